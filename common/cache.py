@@ -0,0 +1,99 @@
+"""
+Cache backends that count hits and misses.
+
+Counts are kept per process and added to two keys of the cache itself every
+``FLUSH_EVERY`` lookups, so with a shared backend (file or Redis) the
+``cache_stats`` command sees the totals of every worker.
+"""
+
+import threading
+
+from django.core.cache.backends import filebased, locmem, redis
+from django.core.cache.backends.base import BaseCache
+
+HITS_KEY = "cache-stats:hits"
+MISSES_KEY = "cache-stats:misses"
+FLUSH_EVERY = 100
+
+_MISSING = object()
+
+
+class CacheStatsMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        # The default get_many() goes through get(), which already counts
+        self._get_many_counts = (
+            super(CacheStatsMixin, self).get_many.__func__ is not BaseCache.get_many
+        )
+
+    def _record(self, hits: int, misses: int) -> None:
+        with self._stats_lock:
+            self._hits += hits
+            self._misses += misses
+            if self._hits + self._misses < FLUSH_EVERY:
+                return
+            hits, misses = self._hits, self._misses
+            self._hits = self._misses = 0
+        self._add_to_stats(hits, misses)
+
+    def _add_to_stats(self, hits: int, misses: int) -> None:
+        for key, value in ((HITS_KEY, hits), (MISSES_KEY, misses)):
+            if not value:
+                continue
+            self.add(key, 0, timeout=None)
+            try:
+                self.incr(key, value)
+            except ValueError:
+                # Evicted between add() and incr()
+                self.set(key, value, timeout=None)
+
+    def flush_stats(self) -> None:
+        with self._stats_lock:
+            hits, misses = self._hits, self._misses
+            self._hits = self._misses = 0
+        self._add_to_stats(hits, misses)
+
+    def get_stats(self) -> tuple[int, int]:
+        """
+        Hits and misses flushed so far, by every process using the cache.
+        """
+        stats = self.get_many([HITS_KEY, MISSES_KEY])
+        return stats.get(HITS_KEY, 0), stats.get(MISSES_KEY, 0)
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self._hits = self._misses = 0
+        self.delete_many([HITS_KEY, MISSES_KEY])
+
+    def get(self, key, default=None, version=None):
+        value = super().get(key, _MISSING, version=version)
+        if key in (HITS_KEY, MISSES_KEY):
+            # Read back by incr() on some backends
+            return default if value is _MISSING else value
+        if value is _MISSING:
+            self._record(0, 1)
+            return default
+        self._record(1, 0)
+        return value
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        values = super().get_many(keys, version=version)
+        if self._get_many_counts and HITS_KEY not in keys:
+            self._record(len(values), len(keys) - len(values))
+        return values
+
+
+class LocMemCache(CacheStatsMixin, locmem.LocMemCache):
+    pass
+
+
+class FileBasedCache(CacheStatsMixin, filebased.FileBasedCache):
+    pass
+
+
+class RedisCache(CacheStatsMixin, redis.RedisCache):
+    pass
@@ -1,5 +1,8 @@
+from django.utils.functional import SimpleLazyObject
+
 from .models import SiteSettings
 
 
 def settings(request):
-    return { 'settings': SiteSettings.load() }
\ No newline at end of file
+    # Only loaded when a template reads it, most pages (and the admin) never do
+    return {"settings": SimpleLazyObject(SiteSettings.load)}
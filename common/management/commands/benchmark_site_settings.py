@@ -0,0 +1,69 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.template import Context, Template
+from django.test import RequestFactory
+from django.test.utils import override_settings
+
+from common.context_processors import settings as settings_context_processor
+from common.models import SiteSettings
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the per-request cost of loading SiteSettings eagerly with the "
+        "lazy context processor, for pages that do and do not use it."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=5000,
+            help="Number of renders per scenario (default: 5000).",
+        )
+
+    def _time(self, render, iterations: int) -> float:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            render()
+        return (time.perf_counter() - start) / iterations * 1_000_000
+
+    def handle(self, *args, **options):
+        iterations: int = options["iterations"]
+        if iterations < 1:
+            raise CommandError("--iterations must be a positive number.")
+
+        request = RequestFactory().get("/")
+        templates = {
+            "unused": Template("{{ request.path }}"),
+            "used": Template("{{ request.path }} {{ settings.pk }}"),
+        }
+
+        def eager(template):
+            context = {"request": request, "settings": SiteSettings.load()}
+            return lambda: template.render(Context(context))
+
+        def lazy(template):
+            def render():
+                context = {"request": request, **settings_context_processor(request)}
+                return template.render(Context(context))
+
+            return render
+
+        SiteSettings.load()
+        self.stdout.write(
+            f"{'Template':<8} {'Revalidate':<11} {'Eager us':>9} {'Lazy us':>9} "
+            f"{'Saving us':>10}"
+        )
+        # "always" is the cost of checking the version on every request
+        for revalidate, seconds in (("cached", None), ("always", 0)):
+            overrides = {} if seconds is None else {"SINGLETON_REVALIDATE_SECONDS": 0}
+            with override_settings(**overrides):
+                for name, template in templates.items():
+                    eager_us = self._time(lambda: eager(template)(), iterations)
+                    lazy_us = self._time(lazy(template), iterations)
+                    self.stdout.write(
+                        f"{name:<8} {revalidate:<11} {eager_us:>9.2f} {lazy_us:>9.2f} "
+                        f"{eager_us - lazy_us:>10.2f}"
+                    )
@@ -0,0 +1,74 @@
+import os
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache
+from django.core.management.base import BaseCommand
+
+from common.cache import CacheStatsMixin
+
+
+class Command(BaseCommand):
+    help = "Report the default cache's configuration, hit/miss rate and size."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Reset the hit/miss counters after reporting them.",
+        )
+
+    def _size(self, cache) -> str:
+        if isinstance(cache, FileBasedCache):
+            files = cache._list_cache_files()
+            size = sum(os.path.getsize(path) for path in files if os.path.exists(path))
+            return f"{len(files)} entries, {size / 1024:.1f} KiB on disk"
+        if isinstance(cache, RedisCache):
+            client = cache._cache.get_client()
+            memory = client.info("memory")
+            return (
+                f"{client.dbsize()} keys in the database, "
+                f"{memory['used_memory_human']} used "
+                f"(maxmemory {memory.get('maxmemory_human', 'unset')}, "
+                f"policy {memory.get('maxmemory_policy', 'unknown')})"
+            )
+        if isinstance(cache, LocMemCache):
+            return f"{len(cache._cache)} entries (this process only)"
+        return "unknown"
+
+    def handle(self, *args, **options):
+        cache = caches["default"]
+        config = settings.CACHES["default"]
+        max_entries = config.get("OPTIONS", {}).get("MAX_ENTRIES")
+
+        self.stdout.write(f"Backend:     {config['BACKEND']}")
+        self.stdout.write(f"Location:    {config.get('LOCATION', '')}")
+        self.stdout.write(f"Key prefix:  {config.get('KEY_PREFIX', '')}")
+        self.stdout.write(f"Max entries: {max_entries or 'backend policy'}")
+        self.stdout.write(f"Size:        {self._size(cache)}")
+
+        if not isinstance(cache, CacheStatsMixin):
+            self.stdout.write(
+                self.style.WARNING("This backend does not count hits and misses.")
+            )
+            return
+
+        cache.flush_stats()
+        hits, misses = cache.get_stats()
+        lookups = hits + misses
+        rate = f"{hits / lookups:.1%}" if lookups else "n/a"
+        self.stdout.write(f"Lookups:     {lookups} ({hits} hits, {misses} misses)")
+        self.stdout.write(f"Hit rate:    {rate}")
+        if isinstance(cache, LocMemCache):
+            self.stdout.write(
+                self.style.WARNING(
+                    "The local-memory cache is per process, these counts do not "
+                    "include the web workers. Use CACHE_BACKEND=file or redis."
+                )
+            )
+
+        if options["reset"]:
+            cache.reset_stats()
+            self.stdout.write(self.style.SUCCESS("Counters reset."))
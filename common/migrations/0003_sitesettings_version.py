@@ -0,0 +1,18 @@
+# Generated by Django 5.0.6 on 2026-10-18 14:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0002_remove_sitesettings_site_parameter'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sitesettings',
+            name='version',
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+    ]
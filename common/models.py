@@ -1,16 +1,40 @@
+import time
+
+from django.conf import settings
 from django.core.cache import cache
 from django.db import models
 
+# Per-process copies of the singletons: model class -> (object, last revalidation)
+_local: dict[type, tuple["AbstractSingleton", float]] = {}
+
 
 class AbstractSingleton(models.Model):
+    """
+    Single-row model cached in two tiers.
+
+    Each process keeps its own copy and reuses it without any query for
+    ``SINGLETON_REVALIDATE_SECONDS``. After that it reads the row's ``version``
+    column, which every ``save()`` stamps, and only reloads the object (from
+    the shared cache, keyed by version, or else the database) when it changed.
+    Saves are therefore picked up by every process, whatever the cache backend.
+    """
+
+    version = models.BigIntegerField(default=0, editable=False)
+
     class Meta:
         abstract = True
 
+    @classmethod
+    def cache_key(cls, version: int) -> str:
+        return f"{cls.__name__}:{version}"
+
     def set_cache(self):
-        cache.set(self.__class__.__name__, self)
+        cache.set(self.cache_key(self.version), self)
+        _local[type(self)] = (self, time.monotonic())
 
     def save(self, *args, **kwargs):
         self.pk = 1
+        self.version = time.time_ns()
         super(AbstractSingleton, self).save(*args, **kwargs)
         self.set_cache()
 
@@ -19,11 +43,25 @@ class AbstractSingleton(models.Model):
 
     @classmethod
     def load(cls):
-        if cache.get(cls.__name__) is None:
+        now = time.monotonic()
+        local = _local.get(cls)
+        if local is not None and now - local[1] < settings.SINGLETON_REVALIDATE_SECONDS:
+            return local[0]
+
+        version = cls.objects.filter(pk=1).values_list("version", flat=True).first()
+        if local is not None and local[0].version == version:
+            _local[cls] = (local[0], now)
+            return local[0]
+
+        obj = cache.get(cls.cache_key(version)) if version is not None else None
+        if obj is None:
             obj, created = cls.objects.get_or_create(pk=1)
             if not created:
                 obj.set_cache()
-        return cache.get(cls.__name__)
+            return obj
+
+        _local[cls] = (obj, now)
+        return obj
 
 
 class SiteSettings(AbstractSingleton):
@@ -0,0 +1,112 @@
+import tempfile
+from pathlib import Path
+from unittest import skipUnless
+
+from django.core.cache import cache
+from django.db import connection
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.test import RequestFactory, TestCase, override_settings
+
+from . import models
+from .cache import FLUSH_EVERY, LocMemCache
+from .context_processors import settings as settings_context_processor
+from .models import SiteSettings
+
+
+class SingletonCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        models._local.clear()
+
+    def test_reuses_the_process_copy_without_queries(self):
+        first = SiteSettings.load()
+
+        with self.assertNumQueries(0):
+            self.assertIs(SiteSettings.load(), first)
+
+    @override_settings(SINGLETON_REVALIDATE_SECONDS=0)
+    def test_revalidation_only_reads_the_version(self):
+        first = SiteSettings.load()
+
+        with self.assertNumQueries(1):
+            self.assertIs(SiteSettings.load(), first)
+
+    @override_settings(SINGLETON_REVALIDATE_SECONDS=0)
+    def test_save_in_another_process_is_picked_up(self):
+        first = SiteSettings.load()
+        # Another process saved the row, this one still has its old copy
+        SiteSettings.objects.filter(pk=1).update(version=first.version + 1)
+
+        loaded = SiteSettings.load()
+
+        self.assertIsNot(loaded, first)
+        self.assertEqual(loaded.version, first.version + 1)
+
+    def test_save_replaces_the_process_copy(self):
+        first = SiteSettings.load()
+
+        saved = SiteSettings.objects.get(pk=1)
+        saved.save()
+
+        self.assertIs(SiteSettings.load(), saved)
+        self.assertNotEqual(saved.version, first.version)
+
+
+class SettingsContextProcessorTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        models._local.clear()
+
+    def test_site_settings_load_on_first_use(self):
+        request = RequestFactory().get("/")
+
+        with self.assertNumQueries(0):
+            context = settings_context_processor(request)
+
+        self.assertEqual(context["settings"].pk, 1)
+
+
+class CacheStatsTests(TestCase):
+    def setUp(self):
+        self.cache = LocMemCache("cache-stats-tests", {})
+        self.cache.clear()
+
+    def test_counts_hits_and_misses(self):
+        self.cache.set("present", None)
+
+        self.assertIsNone(self.cache.get("present", "default"))
+        self.assertEqual(self.cache.get("absent", "default"), "default")
+        self.assertEqual(self.cache.get_many(["present", "absent"]), {"present": None})
+        self.cache.flush_stats()
+
+        self.assertEqual(self.cache.get_stats(), (2, 2))
+
+    def test_flushes_to_the_cache_periodically(self):
+        for _ in range(FLUSH_EVERY):
+            self.cache.get("absent")
+
+        self.assertEqual(self.cache.get_stats(), (0, FLUSH_EVERY))
+
+        self.cache.reset_stats()
+        self.assertEqual(self.cache.get_stats(), (0, 0))
+
+
+@skipUnless(connection.vendor == "sqlite", "SQLite only")
+class SQLitePragmaTests(TestCase):
+    def test_new_connections_are_tuned(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            wrapper = DatabaseWrapper(
+                {**connection.settings_dict, "NAME": Path(tmp) / "db.sqlite3"}
+            )
+            try:
+                with wrapper.cursor() as cursor:
+                    pragmas = {
+                        name: cursor.execute(f"PRAGMA {name}").fetchone()[0]
+                        for name in ("journal_mode", "synchronous", "cache_size")
+                    }
+            finally:
+                wrapper.close()
+
+        self.assertEqual(
+            pragmas, {"journal_mode": "wal", "synchronous": 1, "cache_size": -16384}
+        )
@@ -1,6 +1,7 @@
 from django.contrib import admin
 
-from .models import Category, Fact
+from .cache import bump_catalog_version
+from .models import Category, Fact, FactSchedule
 
 
 @admin.register(Fact)
@@ -10,6 +11,40 @@ class FactAdmin(admin.ModelAdmin):
     search_fields = ("fact", "identifier", "description")
     list_display_links = ("fact", "identifier")
     prepopulated_fields = {"identifier": ("fact",)}
+    readonly_fields = ("position",)
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        bump_catalog_version()
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        Fact.compact_positions()
+        bump_catalog_version()
+
+    def delete_queryset(self, request, queryset):
+        super().delete_queryset(request, queryset)
+        Fact.compact_positions()
+        bump_catalog_version()
+
+
+@admin.register(FactSchedule)
+class FactScheduleAdmin(admin.ModelAdmin):
+    list_display = ("date", "fact")
+    date_hierarchy = "date"
+    raw_id_fields = ("fact",)
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        bump_catalog_version()
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        bump_catalog_version()
+
+    def delete_queryset(self, request, queryset):
+        super().delete_queryset(request, queryset)
+        bump_catalog_version()
 
 
 admin.site.register(Category)
@@ -0,0 +1,69 @@
+import datetime
+import hashlib
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from .models import CatalogVersion, Fact
+
+_MISSING = object()
+
+
+def seconds_until_midnight(now: datetime.datetime | None = None) -> int:
+    """
+    Seconds left until the next UTC midnight, when the fact of the day changes.
+    """
+    now = (now or timezone.now()).astimezone(datetime.timezone.utc)
+    midnight = datetime.datetime.combine(
+        now.date() + datetime.timedelta(days=1),
+        datetime.time.min,
+        tzinfo=datetime.timezone.utc,
+    )
+    return max(1, int((midnight - now).total_seconds()))
+
+
+def get_catalog_version() -> int:
+    """
+    Picked up by every process within ``SINGLETON_REVALIDATE_SECONDS``.
+    """
+    return CatalogVersion.load().version
+
+
+def bump_catalog_version() -> None:
+    """
+    Invalidate every cached daily fact and page after the catalog changes.
+    """
+    CatalogVersion().save()
+
+
+def daily_key(kind: str, date: datetime.date) -> str:
+    return f"facts:{kind}:{date.isoformat()}:{get_catalog_version()}"
+
+
+def get_daily_fact(date: datetime.date) -> Fact | None:
+    key = daily_key("fact", date)
+    fact = cache.get(key, _MISSING)
+    if fact is _MISSING:
+        fact = Fact.get_fact_from_date(date)
+        cache.set(key, fact, timeout=seconds_until_midnight())
+    return fact
+
+
+def daily_etag(fact: Fact | None, date: datetime.date) -> str:
+    if fact is None:
+        source = f"none:{date.isoformat()}"
+    else:
+        source = f"{fact.pk}:{fact.updated_at.isoformat()}:{date.isoformat()}"
+    return f'"{hashlib.sha1(source.encode()).hexdigest()}"'
+
+
+def daily_last_modified(fact: Fact | None, date: datetime.date) -> datetime.datetime:
+    """
+    The page changes at midnight even if the chosen fact itself is older.
+    """
+    day_start = datetime.datetime.combine(
+        date, datetime.time.min, tzinfo=datetime.timezone.utc
+    )
+    if fact is None:
+        return day_start
+    return max(fact.updated_at, day_start)
@@ -0,0 +1,84 @@
+import statistics
+import time
+from importlib import import_module
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from facts.scraping.extractors.parsing import available_parsers
+
+
+class Command(BaseCommand):
+    help = "Time each extractor's HTML parsing with every available parser backend."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "extractors",
+            type=str,
+            nargs="*",
+            help="Extractor class names (default: every extractor).",
+        )
+        parser.add_argument(
+            "--snapshot-dir",
+            type=Path,
+            help=(
+                "Directory with '<ExtractorName>.html' snapshots. Extractors "
+                "without a snapshot fetch their page once."
+            ),
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Number of timed runs per extractor and parser (default: 20).",
+        )
+
+    def handle(self, *args, **options):
+        extractors_module = import_module("facts.scraping.extractors")
+        names: list[str] = options["extractors"] or [
+            name for name in extractors_module.__all__ if not name.startswith("Base")
+        ]
+        snapshot_dir: Path | None = options["snapshot_dir"]
+        repeat: int = options["repeat"]
+
+        if repeat < 1:
+            raise CommandError("--repeat must be a positive number.")
+
+        rows = []
+        for name in names:
+            try:
+                extractor_cls = getattr(extractors_module, name)
+            except AttributeError as exc:
+                raise CommandError(f"Extractor '{name}' not found: {exc}") from exc
+
+            snapshot = snapshot_dir / f"{name}.html" if snapshot_dir else None
+            if snapshot is not None and snapshot.exists():
+                html = snapshot.read_text(encoding="utf-8")
+            else:
+                html = extractor_cls()._fetch()
+
+            for parser in available_parsers():
+                extractor = extractor_cls(parser=parser)
+                timings = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    facts = list(extractor._process_html(html))
+                    timings.append((time.perf_counter() - start) * 1000)
+                rows.append(
+                    (
+                        name,
+                        parser,
+                        len(facts),
+                        min(timings),
+                        statistics.mean(timings),
+                    )
+                )
+
+        self.stdout.write(
+            f"{'Extractor':<45} {'Parser':<12} {'Facts':>5} "
+            f"{'Best ms':>9} {'Mean ms':>9}"
+        )
+        for name, parser, count, best, mean in rows:
+            self.stdout.write(
+                f"{name:<45} {parser:<12} {count:>5} {best:>9.2f} {mean:>9.2f}"
+            )
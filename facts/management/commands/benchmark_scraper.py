@@ -0,0 +1,163 @@
+import logging
+from importlib import import_module
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from facts.scraping.benchmark import (
+    BENCHMARK_STAGES,
+    SNAPSHOT_DIR,
+    compare,
+    load_baseline,
+    run_benchmark,
+    save_baseline,
+    snapshot_path,
+)
+
+
+def _catalog_sizes(value: str) -> list[int]:
+    try:
+        sizes = [int(size) for size in value.split(",")]
+    except ValueError as exc:
+        raise CommandError(f"Invalid catalog sizes '{value}': {exc}") from exc
+    if any(size < 0 for size in sizes):
+        raise CommandError("Catalog sizes must not be negative.")
+    return sizes
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the parse, format and store stages of each extractor on recorded "
+        "HTML snapshots, in a throwaway test database (in-memory with SQLite), "
+        "and compare them with a saved baseline."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "extractors",
+            type=str,
+            nargs="*",
+            help="Extractor class names (default: every extractor).",
+        )
+        parser.add_argument(
+            "--snapshot-dir",
+            type=Path,
+            default=SNAPSHOT_DIR,
+            help="Directory with '<ExtractorName>.html' snapshots.",
+        )
+        parser.add_argument(
+            "--record",
+            action="store_true",
+            help="Fetch each extractor's page and overwrite its snapshot first.",
+        )
+        parser.add_argument(
+            "--catalog-sizes",
+            type=str,
+            default="0,1000,10000",
+            help=(
+                "Comma-separated numbers of facts already stored when the "
+                "snapshot facts are saved (default: 0,1000,10000)."
+            ),
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Number of runs per extractor and catalog size (default: 5).",
+        )
+        parser.add_argument(
+            "--baseline",
+            type=Path,
+            help="Baseline JSON to compare against.",
+        )
+        parser.add_argument(
+            "--save-baseline",
+            type=Path,
+            help="Write the timings of this run as a baseline JSON.",
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.2,
+            help="Relative slowdown reported as a regression (default: 0.2).",
+        )
+
+    def handle(self, *args, **options):
+        extractors_module = import_module("facts.scraping.extractors")
+        names: list[str] = options["extractors"] or [
+            name for name in extractors_module.__all__ if not name.startswith("Base")
+        ]
+        snapshot_dir: Path = options["snapshot_dir"]
+        catalog_sizes = _catalog_sizes(options["catalog_sizes"])
+
+        if options["repeat"] < 1:
+            raise CommandError("--repeat must be a positive number.")
+
+        extractors = []
+        for name in names:
+            try:
+                extractor_cls = getattr(extractors_module, name)
+            except AttributeError as exc:
+                raise CommandError(f"Extractor '{name}' not found: {exc}") from exc
+
+            snapshot = snapshot_path(extractor_cls, snapshot_dir)
+            extractor = extractor_cls()
+            if options["record"]:
+                snapshot.parent.mkdir(parents=True, exist_ok=True)
+                snapshot.write_text(extractor._fetch(), encoding="utf-8")
+                self.stdout.write(f"Recorded {snapshot}")
+            if not snapshot.exists():
+                raise CommandError(
+                    f"No snapshot for {name} at {snapshot}, use --record to create it."
+                )
+            extractors.append((extractor, snapshot.read_text(encoding="utf-8")))
+
+        baseline = load_baseline(options["baseline"]) if options["baseline"] else None
+
+        old_name = connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, serialize=False
+        )
+        # Keep the per-run storage summaries and parsing warnings out of the table
+        logging.disable(logging.WARNING)
+        try:
+            results = run_benchmark(extractors, catalog_sizes, options["repeat"])
+        finally:
+            logging.disable(logging.NOTSET)
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        stage_headers = " ".join(
+            f"{stage.capitalize() + ' ms':>10}" for stage in BENCHMARK_STAGES
+        )
+        self.stdout.write(
+            f"{'Extractor':<45} {'Catalog':>8} {'Facts':>5} {stage_headers}"
+        )
+        for result in results:
+            stage_columns = " ".join(
+                f"{result.seconds[stage] * 1000:>10.2f}" for stage in BENCHMARK_STAGES
+            )
+            self.stdout.write(
+                f"{result.extractor:<45} {result.catalog_size:>8} "
+                f"{result.facts:>5} {stage_columns}"
+            )
+
+        if options["save_baseline"]:
+            save_baseline(results, options["save_baseline"])
+            self.stdout.write(f"Saved baseline to {options['save_baseline']}")
+
+        if baseline is None:
+            return
+
+        regressions = compare(results, baseline, options["tolerance"])
+        for regression in regressions:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{regression.key} {regression.stage}: "
+                    f"{regression.baseline * 1000:.2f} ms -> "
+                    f"{regression.current * 1000:.2f} ms "
+                    f"(+{regression.change:.0%})"
+                )
+            )
+        if regressions:
+            raise CommandError(f"{len(regressions)} stage timings regressed.")
+        self.stdout.write(self.style.SUCCESS("No regressions against the baseline."))
@@ -0,0 +1,83 @@
+import datetime
+import logging
+from bisect import bisect_left
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from facts.cache import bump_catalog_version
+from facts.models import Fact, FactSchedule
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Materialize the fact of the day for a rolling window of upcoming dates."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=365,
+            help="Number of days to schedule, starting at --start (default: 365).",
+        )
+        parser.add_argument(
+            "--start",
+            type=datetime.date.fromisoformat,
+            help="First date to schedule as YYYY-MM-DD (default: today, UTC).",
+        )
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="Replace days already scheduled instead of keeping them.",
+        )
+
+    def handle(self, *args, **options):
+        days: int = options["days"]
+        start: datetime.date = options["start"] or timezone.now().date()
+        rebuild: bool = options["rebuild"]
+
+        if days < 1:
+            raise CommandError("--days must be a positive number")
+
+        dates = [start + datetime.timedelta(days=offset) for offset in range(days)]
+        fact_ids = dict(
+            Fact.objects.filter(position__isnull=False).values_list("position", "pk")
+        )
+        if not fact_ids:
+            raise CommandError("There are no facts to schedule")
+        # Same count and gap handling as Fact.pick_fact_from_date
+        positions = sorted(fact_ids)
+        fact_count = positions[-1] + 1
+
+        def fact_id_for(date: datetime.date) -> int:
+            choice = Fact.position_from_date(date, fact_count)
+            return fact_ids[positions[bisect_left(positions, choice)]]
+
+        with transaction.atomic():
+            window = FactSchedule.objects.filter(date__range=(dates[0], dates[-1]))
+            if rebuild:
+                window.delete()
+                scheduled = set()
+            else:
+                scheduled = set(window.values_list("date", flat=True))
+
+            entries = [
+                FactSchedule(date=date, fact_id=fact_id_for(date))
+                for date in dates
+                if date not in scheduled
+            ]
+            FactSchedule.objects.bulk_create(entries)
+
+        bump_catalog_version()
+
+        logger.info(
+            "Scheduled %s new days between %s and %s", len(entries), dates[0], dates[-1]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Scheduled {len(entries)} days from {dates[0]} to {dates[-1]} "
+                f"({len(scheduled)} already scheduled)."
+            )
+        )
@@ -1,14 +1,29 @@
+import json
 import logging
+import sys
 from importlib import import_module
 
-from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, OutputWrapper
 
+from facts.models import Fact
+from facts.scraping.dedupe import NearDuplicateFilter, dedupe_text
+from facts.scraping.extractors.parsing import (
+    DEFAULT_PARSER,
+    PARSERS,
+    available_parsers,
+    make_parse_pool,
+)
+from facts.scraping.fetchers import CachingFetcher, RequestsFetcher
 from facts.scraping.formatters import BaseFactFormatter
+from facts.scraping.metrics import ScrapeMetrics
 from facts.scraping.scraper import Scraper
 from facts.scraping.storage import BaseStorage
 
 logger = logging.getLogger(__name__)
 
+SEED_BATCH_SIZE = 500
+
 
 def _resolve_class(module_path: str, class_name: str, expected_base: type) -> type:
     """
@@ -36,17 +51,63 @@ def _resolve_class(module_path: str, class_name: str, expected_base: type) -> ty
     return cls
 
 
+def _seed_near_duplicates(dedupe: NearDuplicateFilter) -> None:
+    """
+    Index the stored facts by their stored signatures. Signatures missing or
+    made with other settings are computed once and written back.
+    """
+    stale: list[int] = []
+    for pk, identifier, signature in Fact.objects.values_list(
+        "pk", "identifier", "dedupe_signature"
+    ).iterator():
+        if len(signature) == dedupe.signature_size:
+            dedupe.add(identifier, signature=bytes(signature))
+        else:
+            stale.append(pk)
+
+    for start in range(0, len(stale), SEED_BATCH_SIZE):
+        facts = list(
+            Fact.objects.filter(pk__in=stale[start : start + SEED_BATCH_SIZE]).only(
+                "identifier", "fact", "description"
+            )
+        )
+        for fact in facts:
+            fact.dedupe_signature = dedupe.signature(
+                dedupe_text(fact.fact, fact.description)
+            )
+            dedupe.add(fact.identifier, signature=fact.dedupe_signature)
+        Fact.objects.bulk_update(facts, ["dedupe_signature"])
+    if stale:
+        logger.info(f"Stored near-duplicate signatures of {len(stale)} facts")
+
+
+def _resolve_extractor(name: str) -> type:
+    """
+    Get an extractor class from the package so new extractors can be added easily.
+    """
+    module_path = "facts.scraping.extractors"
+    try:
+        module = import_module(module_path)
+        return getattr(module, name)
+    except (ImportError, AttributeError) as exc:
+        raise CommandError(
+            f"Extractor '{name}' not found in '{module_path}': {exc}"
+        ) from exc
+
+
 class Command(BaseCommand):
     help = (
-        "Run the fact scraper with a chosen extractor, storage, and optional formatter."
+        "Run the fact scraper with one or more extractors, a storage, and an "
+        "optional formatter."
     )
 
     def add_arguments(self, parser):
         parser.add_argument(
-            "extractor",
+            "extractors",
             type=str,
+            nargs="*",
             help=(
-                "Extractor class name (from 'facts.scraping.extractors.*', "
+                "Extractor class names (from 'facts.scraping.extractors.*', "
                 "e.g. 'ScienceFocus121FactsExtractor')."
             ),
         )
@@ -57,6 +118,85 @@ class Command(BaseCommand):
                 "Storage class name (from 'facts.scraping.storage', e.g. 'DBStorage')."
             ),
         )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Run every extractor listed in 'facts.scraping.extractors.__all__'.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Maximum number of extractors fetched concurrently (default: 4).",
+        )
+        parser.add_argument(
+            "--parse-workers",
+            type=int,
+            default=0,
+            help=(
+                "Parse fetched pages in this many worker processes instead of "
+                "the fetching threads (default: 0, no worker processes)."
+            ),
+        )
+        parser.add_argument(
+            "--parser",
+            choices=PARSERS,
+            default=DEFAULT_PARSER,
+            help=(
+                "HTML parser used by the extractors "
+                f"(default: {DEFAULT_PARSER}, the fastest one installed)."
+            ),
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of facts written to storage per batch (default: 500).",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=30,
+            help="Read timeout in seconds for each HTTP request (default: 30).",
+        )
+        parser.add_argument(
+            "--retries",
+            type=int,
+            default=3,
+            help="Retries with exponential backoff per HTTP request (default: 3).",
+        )
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Do not use or update the on-disk HTTP response cache.",
+        )
+        parser.add_argument(
+            "--refresh",
+            action="store_true",
+            help=(
+                "Process sources even when the server reports them unchanged "
+                "since the last run."
+            ),
+        )
+        parser.add_argument(
+            "--near-duplicates",
+            choices=("drop", "flag", "off"),
+            default="flag",
+            help=(
+                "What to do with facts nearly identical to one already stored or "
+                "scraped: drop them, only report them, or skip the check "
+                "(default: flag)."
+            ),
+        )
+        parser.add_argument(
+            "--similarity",
+            type=float,
+            default=0.45,
+            help=(
+                "Minimum similarity (0-1) of fact and description for two facts "
+                "to be near-duplicates (default: 0.45)."
+            ),
+        )
         parser.add_argument(
             "--formatter",
             type=str,
@@ -75,13 +215,45 @@ class Command(BaseCommand):
             action="store_true",
             help="Delete the scraped facts from storage instead of saving them.",
         )
+        parser.add_argument(
+            "--report",
+            type=str,
+            help=(
+                "Write per-stage timings and counters of the run as JSON to this "
+                "file ('-' for stdout, the other output then goes to stderr)."
+            ),
+        )
 
     def handle(self, *args, **options):
-        extractor_name: str = options["extractor"]
+        extractor_names: list[str] = options["extractors"]
         storage_name: str = options["storage"]
         formatter_name: str | None = options["formatter"]
         override: bool = options["override"]
         delete: bool = options["delete"]
+        workers: int = options["workers"]
+
+        report_out = self.stdout
+        if options["report"] == "-":
+            # Keep stdout for the JSON report alone
+            self.stdout = OutputWrapper(options.get("stderr", sys.stderr))
+
+        if options["all"]:
+            extractors_module = import_module("facts.scraping.extractors")
+            extractor_names = [
+                name
+                for name in extractors_module.__all__
+                if not name.startswith("Base")
+            ]
+        if not extractor_names:
+            raise CommandError("Pass at least one extractor name or --all.")
+        if workers < 1:
+            raise CommandError("--workers must be a positive number.")
+        if options["parse_workers"] < 0:
+            raise CommandError("--parse-workers must not be negative.")
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be a positive number.")
+        if options["parser"] not in available_parsers():
+            raise CommandError(f"The '{options['parser']}' parser is not installed.")
 
         formatter: BaseFactFormatter | None = None
         if formatter_name:
@@ -90,48 +262,73 @@ class Command(BaseCommand):
             )
             formatter = formatter_cls()
 
-        # Resolve extractor (from the package so new extractors can be added easily)
-        extractor_module_path = "facts.scraping.extractors"
-        try:
-            extractors_module = import_module(extractor_module_path)
-            extractor_cls = getattr(extractors_module, extractor_name)
-        except (ImportError, AttributeError) as exc:
-            raise CommandError(
-                f"Extractor '{extractor_name}' not found in "
-                f"'{extractor_module_path}': {exc}"
-            ) from exc
-
-        # Instantiate extractor (with formatter if explicitly provided)
-        try:
-            extractor = (
-                extractor_cls()
-                if formatter is None
-                else extractor_cls(formatter=formatter)
+        fetcher = RequestsFetcher(
+            read_timeout=options["timeout"],
+            retries=options["retries"],
+            max_concurrency=workers,
+        )
+        if not options["no_cache"]:
+            fetcher = CachingFetcher(
+                settings.SCRAPING_CACHE_DIR,
+                fetcher=fetcher,
+                skip_unchanged=not (options["refresh"] or delete),
             )
-        except TypeError as exc:
-            raise CommandError(
-                "Could not instantiate extractor "
-                f"'{extractor_name}' (formatter={formatter_name or 'default'}): {exc}"
-            ) from exc
+        extractor_kwargs = {"fetcher": fetcher, "parser": options["parser"]}
+        if formatter is not None:
+            extractor_kwargs["formatter"] = formatter
+        parse_pool = None
+        if options["parse_workers"]:
+            parse_pool = make_parse_pool(options["parse_workers"])
+            extractor_kwargs["parse_executor"] = parse_pool
+
+        extractors = []
+        for extractor_name in dict.fromkeys(extractor_names):
+            extractor_cls = _resolve_extractor(extractor_name)
+
+            # Instantiate extractor (with formatter if explicitly provided)
+            try:
+                extractors.append(extractor_cls(**extractor_kwargs))
+            except TypeError as exc:
+                raise CommandError(
+                    "Could not instantiate extractor "
+                    f"'{extractor_name}' (formatter={formatter_name or 'default'}): "
+                    f"{exc}"
+                ) from exc
 
         # Resolve storage
         storage_cls = _resolve_class(
             "facts.scraping.storage", storage_name, BaseStorage
         )
-        storage: BaseStorage = storage_cls(override=override)
+        storage: BaseStorage = storage_cls(
+            override=override, chunk_size=options["chunk_size"]
+        )
 
-        scraper = Scraper(extractor=extractor, storage=storage)
+        dedupe: NearDuplicateFilter | None = None
+        if options["near_duplicates"] != "off" and not delete:
+            # Stored facts are only indexed once an extractor yields a fact
+            dedupe = NearDuplicateFilter(
+                threshold=options["similarity"],
+                drop=options["near_duplicates"] == "drop",
+                seed=_seed_near_duplicates,
+            )
+
+        scraper = Scraper(
+            extractor=extractors, storage=storage, max_workers=workers, dedupe=dedupe
+        )
 
+        extractors_label = ", ".join(dict.fromkeys(extractor_names))
         logger.info(
-            "Running scraper with extractor=%s, storage=%s, formatter=%s, override=%s",
-            extractor_name,
+            "Running scraper with extractors=%s, storage=%s, formatter=%s, "
+            "override=%s, workers=%s",
+            extractors_label,
             storage_name,
             formatter_name or "<extractor default>",
             override,
+            workers,
         )
         self.stdout.write(
             self.style.HTTP_INFO(
-                f"Starting scrape using {extractor_name} -> {storage_name} "
+                f"Starting scrape using {extractors_label} -> {storage_name} "
                 f"(formatter={formatter_name or 'extractor default'}, "
                 f"override={override}, delete={delete})"
             )
@@ -140,7 +337,92 @@ class Command(BaseCommand):
         if delete and override:
             logger.warning("Override flag is ignored when delete mode is enabled.")
 
-        scraper.scrape(delete=delete)
+        try:
+            result = scraper.scrape(delete=delete)
+        finally:
+            if parse_pool is not None:
+                parse_pool.shutdown(cancel_futures=True)
+
+        if options["report"]:
+            self._write_report(scraper.metrics, options["report"], report_out)
+
+        for extractor in scraper.failed:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{type(extractor).__name__} failed, its facts were skipped."
+                )
+            )
+        for extractor in scraper.unchanged:
+            self.stdout.write(f"{type(extractor).__name__} unchanged, skipped.")
+        for extractor in scraper.empty:
+            self.stdout.write(
+                self.style.WARNING(f"{type(extractor).__name__} found no facts.")
+            )
+        if len(scraper.failed) == len(extractors):
+            raise CommandError("Every extractor failed.")
+
+        if isinstance(fetcher, CachingFetcher):
+            # Sources that failed or came back empty are fetched in full next time
+            skipped = (*scraper.failed, *scraper.empty)
+            fetcher.commit(
+                url
+                for extractor in extractors
+                if extractor not in skipped
+                for url in (extractor.url, *getattr(extractor, "page_urls", ()))
+            )
 
         action = "Deletion" if delete else "Scraping"
         self.stdout.write(self.style.SUCCESS(f"{action} completed successfully."))
+        if delete:
+            self.stdout.write(
+                f"{result.deleted} deleted, {len(result.missing)} not found."
+            )
+        else:
+            self.stdout.write(
+                f"{result.created} created, {result.updated} updated, "
+                f"{result.unchanged} unchanged."
+            )
+            if dedupe is not None and dedupe.duplicates:
+                verb = "skipped" if dedupe.drop else "flagged"
+                self.stdout.write(
+                    f"{len(dedupe.duplicates)} near-duplicate facts {verb}."
+                )
+                if options["verbosity"] > 1:
+                    for duplicate, original in dedupe.duplicates:
+                        self.stdout.write(f"  = {duplicate} ~ {original}")
+            if options["verbosity"] > 1:
+                for identifier in result.created_identifiers:
+                    self.stdout.write(f"  + {identifier}")
+                for identifier in result.updated_identifiers:
+                    self.stdout.write(f"  ~ {identifier}")
+
+        if options["verbosity"] > 0:
+            self._write_metrics(scraper.metrics)
+
+    def _write_metrics(self, metrics: ScrapeMetrics) -> None:
+        self.stdout.write("")
+        self.stdout.write(
+            f"{'Stage':<8} {'Calls':>7} {'Total s':>9} {'Mean ms':>9} {'Max ms':>9}"
+        )
+        for stage, stats in metrics.stages.items():
+            self.stdout.write(
+                f"{stage:<8} {stats.calls:>7} {stats.seconds:>9.2f} "
+                f"{stats.mean_seconds * 1000:>9.2f} {stats.max_seconds * 1000:>9.2f}"
+            )
+        downloaded = metrics.counters.get("bytes_downloaded", 0) / 1024
+        self.stdout.write(
+            f"{downloaded:.1f} KiB downloaded, {metrics.elapsed:.2f}s in total."
+        )
+
+    def _write_report(
+        self, metrics: ScrapeMetrics, path: str, stdout: OutputWrapper
+    ) -> None:
+        report = json.dumps(metrics.as_dict(), indent=2)
+        if path == "-":
+            stdout.write(report)
+            return
+        try:
+            with open(path, "w", encoding="utf-8") as report_file:
+                report_file.write(report + "\n")
+        except OSError as exc:
+            raise CommandError(f"Could not write report to '{path}': {exc}") from exc
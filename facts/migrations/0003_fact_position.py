@@ -0,0 +1,27 @@
+# Generated by Django 5.0.6 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+def populate_positions(apps, schema_editor):
+    Fact = apps.get_model("facts", "Fact")
+    facts = list(Fact.objects.order_by("pk"))
+    for position, fact in enumerate(facts):
+        fact.position = position
+    Fact.objects.bulk_update(facts, ["position"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facts', '0002_fact_identifier'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='fact',
+            name='position',
+            field=models.PositiveIntegerField(blank=True, editable=False, help_text='Dense 0-based index used to pick the fact of the day', null=True, unique=True),
+        ),
+        migrations.RunPython(populate_positions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.0.6 on 2026-10-18 13:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facts', '0003_fact_position'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FactSchedule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('fact', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='schedule', to='facts.fact')),
+            ],
+            options={
+                'ordering': ('date',),
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.0.6 on 2026-10-18 16:40
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def populate_content_hashes(apps, schema_editor):
+    Fact = apps.get_model("facts", "Fact")
+    facts = list(Fact.objects.only("pk", "fact", "description"))
+    for fact in facts:
+        content = f"{fact.fact}\0{fact.description}"
+        fact.content_hash = hashlib.sha256(content.encode()).hexdigest()
+    Fact.objects.bulk_update(facts, ["content_hash"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facts', '0004_factschedule'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='fact',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, help_text='SHA-256 of the fact and description, used to skip unchanged facts', max_length=64),
+        ),
+        migrations.RunPython(populate_content_hashes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.6 on 2026-10-18 14:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facts', '0005_fact_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='fact',
+            index=models.Index(fields=['created_at'], name='fact_created_at_idx'),
+        ),
+    ]
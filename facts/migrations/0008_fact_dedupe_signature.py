@@ -0,0 +1,18 @@
+# Generated by Django 5.0.6 on 2026-10-18 15:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facts', '0007_catalogversion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='fact',
+            name='dedupe_signature',
+            field=models.BinaryField(blank=True, default=b'', help_text='MinHash signature of the fact and description, used to flag near-duplicates'),
+        ),
+    ]
@@ -1,7 +1,11 @@
 import datetime
+import hashlib
 import random
 
-from django.db import models
+from django.db import models, transaction
+
+from common.models import AbstractSingleton
+from facts.scraping.dedupe import fact_signature
 
 
 class Category(models.Model):
@@ -19,20 +23,145 @@ class Fact(models.Model):
     identifier = models.SlugField(max_length=255, unique=True)
     fact = models.CharField(max_length=255)
     description = models.TextField()
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        editable=False,
+        help_text="SHA-256 of the fact and description, used to skip unchanged facts",
+    )
+    dedupe_signature = models.BinaryField(
+        blank=True,
+        default=b"",
+        help_text="MinHash signature of the fact and description, used to flag "
+        "near-duplicates",
+    )
+    position = models.PositiveIntegerField(
+        unique=True,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Dense 0-based index used to pick the fact of the day",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     categories = models.ManyToManyField(Category, related_name="facts")
 
+    class Meta:
+        # ``position`` (date selection) and the categories through table are
+        # indexed by their unique constraints and foreign keys already
+        indexes = [models.Index(fields=["created_at"], name="fact_created_at_idx")]
+
     def __str__(self):
         return self.fact
 
+    def save(self, *args, **kwargs):
+        self.content_hash = self.compute_content_hash(self.fact, self.description)
+        self.dedupe_signature = fact_signature(self.fact, self.description)
+        if self.position is not None:
+            super().save(*args, **kwargs)
+            return
+
+        with transaction.atomic():
+            self.lock_positions()
+            self.position = self.__class__.next_position()
+            super().save(*args, **kwargs)
+
+    @staticmethod
+    def compute_content_hash(fact: str, description: str) -> str:
+        return hashlib.sha256(f"{fact}\0{description}".encode()).hexdigest()
+
     @classmethod
-    def get_fact_from_date(cls, date: datetime.date):
-        num_date = date.toordinal()
-        fact_count = cls.objects.count()
+    def next_position(cls) -> int:
+        last = cls.objects.aggregate(last=models.Max("position"))["last"]
+        return 0 if last is None else last + 1
+
+    @staticmethod
+    def lock_positions() -> None:
+        """
+        Serialize position changes by locking the catalog version row until
+        the surrounding transaction ends. Call it before reading positions.
+
+        A no-op ``UPDATE`` rather than ``SELECT ... FOR UPDATE``, so SQLite,
+        which ignores the latter, takes its write lock up front as well.
+        """
+        locked = CatalogVersion.objects.filter(pk=1).update(version=models.F("version"))
+        if not locked:
+            # Inserted directly: ``save()`` would stamp a new version
+            CatalogVersion.objects.bulk_create(
+                [CatalogVersion(pk=1)], ignore_conflicts=True
+            )
+            CatalogVersion.objects.filter(pk=1).update(version=models.F("version"))
+
+    @classmethod
+    def compact_positions(cls) -> None:
+        """
+        Keep positions dense (``0..count-1``) after deletions by moving the
+        facts with the highest positions into the gaps.
+        """
+        with transaction.atomic():
+            cls.lock_positions()
+            count = cls.objects.count()
+            taken = set(
+                cls.objects.filter(position__lt=count).values_list(
+                    "position", flat=True
+                )
+            )
+            gaps = (position for position in range(count) if position not in taken)
+            movers = list(
+                cls.objects.filter(
+                    models.Q(position__gte=count) | models.Q(position__isnull=True)
+                ).order_by(models.F("position").asc(nulls_last=True), "pk")
+            )
+            for fact, position in zip(movers, gaps):
+                fact.position = position
+            cls.objects.bulk_update(movers, ["position"])
+
+    @staticmethod
+    def position_from_date(date: datetime.date, fact_count: int) -> int:
+        rng = random.Random(date.toordinal())
+        return rng.choice(range(fact_count))
+
+    @classmethod
+    def pick_fact_from_date(cls, date: datetime.date):
+        """
+        Live date-to-fact selection over the current catalog, used for days
+        missing from the precomputed ``FactSchedule``.
+
+        Deletes outside ``DBStorage`` and the admin leave gaps in the
+        positions; a choice landing on one falls through to the next fact.
+        """
+        fact_count = cls.next_position()
         if fact_count == 0:
             return None
-        rng = random.Random(num_date)
-        choice = rng.choice(range(fact_count))
-        fact = cls.objects.all()[choice]
+        choice = cls.position_from_date(date, fact_count)
+        return cls.objects.filter(position__gte=choice).order_by("position").first()
+
+    @classmethod
+    def get_fact_from_date(cls, date: datetime.date):
+        fact = cls.objects.filter(schedule__date=date).first()
+        if fact is None:
+            fact = cls.pick_fact_from_date(date)
         return fact
+
+
+class FactSchedule(models.Model):
+    date = models.DateField(unique=True)
+    fact = models.ForeignKey(Fact, on_delete=models.CASCADE, related_name="schedule")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ("date",)
+
+    def __str__(self):
+        return f"{self.date}: {self.fact}"
+
+
+class CatalogVersion(AbstractSingleton):
+    """
+    Stamped whenever facts or the schedule change. Daily cache keys include
+    the version, so changes made by any process (e.g. ``scrape_facts``)
+    retire the cached pages of every worker, whatever the cache backend.
+    """
+
+    def __str__(self):
+        return str(self.version)
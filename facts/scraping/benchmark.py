@@ -0,0 +1,155 @@
+"""
+Offline benchmark of the scraping pipeline.
+
+Recorded HTML snapshots are parsed and formatted by their extractor and the
+facts are stored with ``DBStorage`` on top of a catalog of a given size. Stage
+timings come from ``ScrapeMetrics``; nothing is fetched. Every run is rolled
+back, so the database is left as it was found.
+"""
+
+import json
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from django.db import transaction
+
+from facts.models import Fact
+from facts.scraping.extractors.parsing import process_html
+from facts.scraping.metrics import ScrapeMetrics, recording
+from facts.scraping.storage import DBStorage
+from facts.scraping.storage.db import BATCH_SIZE
+
+SNAPSHOT_DIR = Path(__file__).resolve().parent.parent / "testdata" / "snapshots"
+
+BENCHMARK_STAGES = ("parse", "format", "store")
+
+# Differences below this are noise, whatever the relative change
+MIN_REGRESSION_SECONDS = 0.001
+
+
+@dataclass
+class BenchmarkResult:
+    extractor: str
+    catalog_size: int
+    facts: int
+    # Best time per stage over the repeated runs
+    seconds: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        return f"{self.extractor}@{self.catalog_size}"
+
+
+@dataclass
+class Regression:
+    key: str
+    stage: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        return self.current / self.baseline - 1 if self.baseline else float("inf")
+
+
+def snapshot_path(extractor_cls: type, snapshot_dir: Path = SNAPSHOT_DIR) -> Path:
+    return snapshot_dir / f"{extractor_cls.__name__}.html"
+
+
+def seed_catalog(size: int) -> None:
+    """
+    Fill the catalog with ``size`` placeholder facts.
+    """
+    facts = []
+    for index in range(size):
+        text = f"Benchmark fact number {index}"
+        facts.append(
+            Fact(
+                identifier=f"benchmark-fact-{index}",
+                fact=text,
+                description="",
+                content_hash=Fact.compute_content_hash(text, ""),
+                position=index,
+            )
+        )
+    Fact.objects.bulk_create(facts, batch_size=BATCH_SIZE)
+
+
+def measure(extractor, html: str) -> tuple[int, ScrapeMetrics]:
+    """
+    Parse, format and store the facts of one page once.
+    """
+    with recording(ScrapeMetrics()) as metrics:
+        facts = list(process_html(extractor, html))
+        with transaction.atomic():
+            # A version bump would also reach the configured cache, which the
+            # live site may share, and nothing here outlives the rollback
+            DBStorage(bump_version=False).save(facts)
+            transaction.set_rollback(True)
+    return len(facts), metrics
+
+
+def run_benchmark(
+    extractors: Iterable[tuple[object, str]],
+    catalog_sizes: Sequence[int],
+    repeat: int = 5,
+) -> list[BenchmarkResult]:
+    """
+    Benchmark every ``(extractor, html)`` pair at every catalog size.
+    """
+    extractors = list(extractors)
+    results = []
+
+    for size in catalog_sizes:
+        with transaction.atomic():
+            seed_catalog(size)
+
+            for extractor, html in extractors:
+                result = BenchmarkResult(type(extractor).__name__, size, facts=0)
+                for _ in range(repeat):
+                    result.facts, metrics = measure(extractor, html)
+                    for stage in BENCHMARK_STAGES:
+                        seconds = metrics.stages[stage].seconds
+                        best = result.seconds.get(stage, seconds)
+                        result.seconds[stage] = min(best, seconds)
+                results.append(result)
+
+            transaction.set_rollback(True)
+
+    return results
+
+
+def load_baseline(path: Path) -> dict[str, dict[str, float]]:
+    with open(path, encoding="utf-8") as baseline_file:
+        return json.load(baseline_file)
+
+
+def save_baseline(results: Iterable[BenchmarkResult], path: Path) -> None:
+    baseline = {result.key: result.seconds for result in results}
+    with open(path, "w", encoding="utf-8") as baseline_file:
+        json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+        baseline_file.write("\n")
+
+
+def compare(
+    results: Iterable[BenchmarkResult],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float = 0.2,
+) -> list[Regression]:
+    """
+    Stages more than ``tolerance`` (relative) slower than in ``baseline``.
+    Results missing from the baseline are not compared.
+    """
+    regressions = []
+    for result in results:
+        for stage, current in result.seconds.items():
+            previous = baseline.get(result.key, {}).get(stage)
+            if previous is None:
+                continue
+            if (
+                current > previous * (1 + tolerance)
+                and current - previous > MIN_REGRESSION_SECONDS
+            ):
+                regressions.append(Regression(result.key, stage, previous, current))
+    return regressions
@@ -0,0 +1,215 @@
+import hashlib
+import logging
+import random
+import re
+import unicodedata
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+
+from facts.scraping.types import Fact as FactType
+
+logger = logging.getLogger(__name__)
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+SHINGLE_SIZE = 3
+BANDS = 48
+ROWS = 3
+
+# Part of the stored signatures, like the settings above; among the salts that
+# tell the labelled pairs apart, the one with the widest margin
+_SALT = (159).to_bytes(2, "little")
+_EMPTY_BIN = 2**64 - 1
+
+
+def normalize(text: str) -> str:
+    """
+    Lowercase, strip accents and punctuation, and collapse whitespace.
+    """
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return _NON_WORD.sub(" ", text.lower()).strip()
+
+
+def dedupe_text(fact: str, description: str) -> str:
+    """
+    Text compared between facts. Titles alone are too short: facts from one
+    template ("Cows/Goats have best friends") look alike while rewordings
+    ("Honey never spoils/expires") do not.
+    """
+    return f"{fact}\n{description}"
+
+
+def fact_signature(fact: str, description: str) -> bytes:
+    """
+    Signature stored with each fact, for a filter with the default settings.
+    """
+    return _default_filter.signature(dedupe_text(fact, description))
+
+
+class NearDuplicateFilter:
+    """
+    Flags facts whose normalized fact and description are nearly identical to
+    one seen before, in roughly linear time.
+
+    Each fact gets a MinHash signature over character shingles; signatures are
+    split into bands and bucketed (locality-sensitive hashing), so only facts
+    sharing a band bucket are compared. Candidates whose estimated Jaccard
+    similarity reaches ``threshold`` are duplicates. The defaults are tuned on
+    the labelled pairs in ``facts/testdata/near_duplicate_pairs.json``.
+
+    Signatures use one-permutation hashing: each shingle is hashed once and
+    lands in one of ``bands * rows`` bins, which keep their minimum. Empty bins
+    borrow the value of a fixed, per-bin sequence of other bins. Signatures are
+    packed 64-bit values (``signature_size`` bytes) that can be stored and
+    passed back to ``add``.
+
+    With ``drop`` on, duplicates are removed from the stream (the first fact
+    seen wins); otherwise they are only logged and recorded in ``duplicates``.
+    ``seed``, if given, is called with the filter before the first fact is
+    checked, to index the facts already stored only when there is something
+    to compare with them.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.45,
+        shingle_size: int = SHINGLE_SIZE,
+        bands: int = BANDS,
+        rows: int = ROWS,
+        drop: bool = False,
+        seed: Callable[["NearDuplicateFilter"], None] | None = None,
+    ) -> None:
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.bands = bands
+        self.rows = rows
+        self.drop = drop
+        self.seed = seed
+        # Pairs of (duplicate identifier, original identifier)
+        self.duplicates: list[tuple[str, str]] = []
+
+        self._bins = bands * rows
+        self.signature_size = 8 * self._bins
+        rng = random.Random(self._bins)
+        self._borrow_order = [
+            [other for other in rng.sample(range(self._bins), self._bins) if other != i]
+            for i in range(self._bins)
+        ]
+        self._signatures: dict[str, bytes] = {}
+        # One dict per band, from the hash of the band's values to the
+        # identifier in the bucket, or a list once there are several
+        self._buckets: list[dict[int, str | list[str]]] = [{} for _ in range(bands)]
+
+    def _shingles(self, text: str) -> set[bytes]:
+        text = normalize(text)
+        size = self.shingle_size
+        if len(text) <= size:
+            return {text.encode()}
+        return {text[i : i + size].encode() for i in range(len(text) - size + 1)}
+
+    def signature(self, text: str) -> bytes:
+        """
+        MinHash signature of ``text``, ``signature_size`` bytes long.
+        """
+        bins = self._bins
+        minimums = array("Q", [_EMPTY_BIN]) * bins
+        for shingle in self._shingles(text):
+            digest = hashlib.blake2b(shingle, digest_size=8, salt=_SALT).digest()
+            value, index = divmod(int.from_bytes(digest, "little"), bins)
+            if value < minimums[index]:
+                minimums[index] = value
+
+        signature = array("Q", minimums)
+        for index, value in enumerate(minimums):
+            if value != _EMPTY_BIN:
+                continue
+            for other in self._borrow_order[index]:
+                if minimums[other] != _EMPTY_BIN:
+                    signature[index] = minimums[other]
+                    break
+        return signature.tobytes()
+
+    def _band_keys(self, signature: bytes) -> Iterator[tuple[int, int]]:
+        view = memoryview(signature)
+        width = 8 * self.rows
+        for band in range(self.bands):
+            yield band, hash(view[band * width : (band + 1) * width])
+
+    def _bucket(self, band: int, key: int) -> Iterable[str]:
+        found = self._buckets[band].get(key, ())
+        return (found,) if isinstance(found, str) else found
+
+    def _similarity(self, first: bytes, second: bytes) -> float:
+        first_values = memoryview(first).cast("Q")
+        second_values = memoryview(second).cast("Q")
+        matches = sum(a == b for a, b in zip(first_values, second_values))
+        return matches / len(first_values)
+
+    def find_duplicate(self, identifier: str, text: str) -> str | None:
+        """
+        Identifier of an indexed fact nearly identical to ``text``, if any.
+        Facts with the same identifier are the same fact, not duplicates.
+        """
+        if self.seed is not None:
+            seed, self.seed = self.seed, None
+            seed(self)
+
+        signature = self.signature(text)
+        candidates = {
+            other
+            for band, key in self._band_keys(signature)
+            for other in self._bucket(band, key)
+            if other != identifier
+        }
+        for other in sorted(candidates):
+            similarity = self._similarity(signature, self._signatures[other])
+            if similarity >= self.threshold:
+                return other
+        return None
+
+    def add(
+        self, identifier: str, text: str | None = None, signature: bytes | None = None
+    ) -> None:
+        """
+        Index a fact by its text or by a ``signature`` stored from an earlier
+        run with the same settings.
+        """
+        if identifier in self._signatures:
+            return
+        if signature is None:
+            signature = self.signature(text)
+        elif len(signature) != self.signature_size:
+            raise ValueError(f"Signature of {identifier} has the wrong size")
+        self._signatures[identifier] = signature
+        for band, key in self._band_keys(signature):
+            bucket = self._buckets[band]
+            found = bucket.get(key)
+            if found is None:
+                bucket[key] = identifier
+            elif isinstance(found, str):
+                bucket[key] = [found, identifier]
+            else:
+                found.append(identifier)
+
+    def filter(self, facts: Iterable[FactType]) -> Iterator[FactType]:
+        for fact in facts:
+            text = dedupe_text(fact.fact, fact.description)
+            original = self.find_duplicate(fact.identifier, text)
+            if original is None:
+                self.add(fact.identifier, text)
+                yield fact
+                continue
+
+            self.duplicates.append((fact.identifier, original))
+            logger.debug(
+                "Fact %s is a near-duplicate of %s%s",
+                fact.identifier,
+                original,
+                ", skipping it" if self.drop else "",
+            )
+            if not self.drop:
+                yield fact
+
+
+_default_filter = NearDuplicateFilter()
@@ -3,11 +3,13 @@ from .hoorayheroes_fun_facts import (
     HooRayHeroesAnimalsFunFactsExtractor,
     HooRayHeroesMythBustingFunFactsExtractor,
 )
+from .paginated import BasePaginatedExtractor
 from .sciencefocus_121_facts import ScienceFocus121FactsExtractor
 from .today_interesting_facts_adults import TodayInterestingFactsAdultsExtractor
 
 __all__ = [
     "BaseExtractor",
+    "BasePaginatedExtractor",
     "ScienceFocus121FactsExtractor",
     "TodayInterestingFactsAdultsExtractor",
     "HooRayHeroesAnimalsFunFactsExtractor",
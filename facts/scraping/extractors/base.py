@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from typing import Protocol
 
 from bs4 import Tag
@@ -10,8 +11,8 @@ class BaseExtractor(Protocol):
 
     def _fetch(self) -> str: ...
 
-    def _process_html(self, html: str) -> list[FactType]: ...
+    def _process_html(self, html: str) -> Iterator[FactType]: ...
 
     def _process_fact(self, raw_fact: Tag) -> FactType: ...
 
-    def run(self) -> list[FactType]: ...
+    def run(self) -> Iterator[FactType]: ...
@@ -1,11 +1,24 @@
 import logging
+from collections.abc import Iterator
+from concurrent.futures import Executor
 
-import requests
-from bs4 import BeautifulSoup, SoupStrainer, Tag
+from bs4 import SoupStrainer, Tag
 from django.utils.text import slugify
-from playwright.sync_api import TimeoutError as PlaywrightTimeoutError, sync_playwright
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from facts.scraping.extractors import BaseExtractor
+from facts.scraping.extractors.parsing import DEFAULT_PARSER, make_soup, process_html
+from facts.scraping.fetchers import (
+    BaseFetcher,
+    BrowserPool,
+    CachingFetcher,
+    FetchStrategyStore,
+    NotModified,
+    get_browser_pool,
+    get_default_fetcher,
+    get_strategy_store,
+)
+from facts.scraping.fetchers.strategies import BROWSER, HTTP
 from facts.scraping.formatters import BaseFactFormatter, HoorayHeroesFactFormatter
 from facts.scraping.types import Fact as FactType
 
@@ -13,76 +26,118 @@ logger = logging.getLogger(__name__)
 
 
 BASE_URL = "https://hoorayheroes.com/"
+CONTENT_SELECTOR = "section.cms-content h2"
 
 
 class HoorayHeroesFunFactsExtractor(BaseExtractor):
     def __init__(
-        self, formatter: BaseFactFormatter = HoorayHeroesFactFormatter()
+        self,
+        formatter: BaseFactFormatter = HoorayHeroesFactFormatter(),
+        fetcher: BaseFetcher | None = None,
+        browser: BrowserPool | None = None,
+        strategies: FetchStrategyStore | None = None,
+        parser: str = DEFAULT_PARSER,
+        parse_executor: Executor | None = None,
     ) -> None:
         self.formatter = formatter
+        self.fetcher = fetcher or get_default_fetcher()
+        self.browser = browser or get_browser_pool()
+        self.strategies = strategies or get_strategy_store()
+        self.parser = parser
+        self.parse_executor = parse_executor
 
-    def _fetch(self) -> str:
-        logger.info(f"Fetching {self.url}")
+    def _has_content(self, html: str) -> bool:
+        content_section = SoupStrainer("section", class_="cms-content")
+        soup = make_soup(html, content_section, self.parser)
+        return soup.find("h2") is not None
+
+    def _fetch_with_browser(self) -> str | None:
         try:
             logger.info("Using Playwright to wait for content to load")
-            with sync_playwright() as p:
-                browser = p.chromium.launch(
-                    headless=True,
-                    args=["--no-sandbox", "--disable-dev-shm-usage"],
-                )
-                page = browser.new_page()
-                page.goto(self.url, wait_until="networkidle")
-                page.wait_for_selector("section.cms-content h2", timeout=20_000)
-                html = page.content()
-                browser.close()
+            return self.browser.render(self.url, wait_for_selector=CONTENT_SELECTOR)
+        except PlaywrightTimeoutError as exc:
+            logger.warning("Playwright timed out for %s (%s).", self.url, exc)
+        except Exception as exc:
+            logger.warning("Playwright fetch failed for %s (%s).", self.url, exc)
+        return None
 
+    def _fetch(self) -> str:
+        """
+        Probe with plain HTTP first and only escalate to a browser when the
+        content is not server-rendered. The strategy that worked is remembered
+        per URL so later runs go straight to it. Raises ``RuntimeError`` when
+        neither strategy gets the content, rather than returning an empty
+        shell that would be cached as the page.
+
+        The probed shell is never kept as the cached page: its validators
+        would otherwise make a later plain HTTP fallback look unchanged.
+        """
+        logger.info(f"Fetching {self.url}")
+
+        tried_browser = self.strategies.get(self.url) == BROWSER
+        if tried_browser:
+            html = self._fetch_with_browser()
+            if html is not None:
+                logger.info(f"Fetched {self.url} successfully")
+                return html
+            logger.warning("Falling back to plain HTTP for %s.", self.url)
+
+        try:
+            html = self.fetcher.fetch(self.url)
+        except NotModified:
+            if not tried_browser:
+                raise
+            # The cached page was rendered by the browser, which failed now
+            raise RuntimeError(
+                f"The browser did not render {self.url} and plain HTTP "
+                "only confirmed the cached response"
+            ) from None
+        if self._has_content(html):
+            self.strategies.set(self.url, HTTP)
             logger.info(f"Fetched {self.url} successfully")
             return html
-        except PlaywrightTimeoutError as exc:
-            logger.warning(
-                "Playwright timed out for %s (%s). Falling back to requests.",
-                self.url,
-                exc,
-            )
-        except Exception as exc:
-            logger.warning(
-                "Playwright fetch failed for %s (%s). Falling back to requests.",
-                self.url,
-                exc,
-            )
 
-        response = requests.get(self.url)
-        response.raise_for_status()
-        return response.text
+        if not tried_browser:
+            logger.info(f"{self.url} is not server-rendered, escalating to Playwright")
+            rendered = self._fetch_with_browser()
+            if rendered is not None:
+                if isinstance(self.fetcher, CachingFetcher):
+                    self.fetcher.discard(self.url)
+                self.strategies.set(self.url, BROWSER)
+                logger.info(f"Fetched {self.url} successfully")
+                return rendered
+
+        raise RuntimeError(
+            f"{self.url} is not server-rendered and the browser did not render it"
+        )
 
-    def _process_html(self, html: str) -> list[FactType]:
+    def _process_html(self, html: str) -> Iterator[FactType]:
         logger.info(f"Processing HTML for {self.url}")
 
         content_section = SoupStrainer("section", class_="cms-content")
-        soup = BeautifulSoup(html, "html.parser", parse_only=content_section)
+        soup = make_soup(html, content_section, self.parser)
 
-        facts: list[FactType] = []
         for index, heading in enumerate(soup.find_all("h2")):
-            logger.info(f"Processing fact #{index}")
-            desc_tag = heading.find_next_sibling(
-                lambda el: isinstance(el, Tag) and el.name == "p"
-            )
-            fact_wrapper = soup.new_tag("div")
-            fact_wrapper.append(heading)
-            if desc_tag:
-                fact_wrapper.append(desc_tag)
-
-            facts.append(self._process_fact(fact_wrapper))
-
-        return facts
+            logger.debug(f"Processing fact #{index}")
+            yield self._process_fact(heading)
+
+    def _description_tag(self, heading: Tag) -> Tag | None:
+        """
+        First ``<p>`` after ``heading`` and before the next ``<h2>``.
+        """
+        for sibling in heading.next_siblings:
+            if not isinstance(sibling, Tag):
+                continue
+            if sibling.name == "h2":
+                return None
+            if sibling.name == "p":
+                return sibling
+        return None
 
     def _process_fact(self, fact_html: Tag) -> FactType:
-        heading = fact_html.find("h2")
-        fact_text = heading.get_text(strip=True)
+        fact_text = fact_html.get_text(strip=True)
 
-        desc_tag = heading.find_next_sibling(
-            lambda el: isinstance(el, Tag) and el.name == "p"
-        )
+        desc_tag = self._description_tag(fact_html)
 
         if desc_tag is None:
             logger.warning(
@@ -99,9 +154,9 @@ class HoorayHeroesFunFactsExtractor(BaseExtractor):
 
         return FactType(fact=fact_text, identifier=identifier, description=desc_html)
 
-    def run(self) -> list[FactType]:
+    def run(self) -> Iterator[FactType]:
         html = self._fetch()
-        return self._process_html(html)
+        yield from process_html(self, html, self.parse_executor)
 
 
 class HooRayHeroesAnimalsFunFactsExtractor(HoorayHeroesFunFactsExtractor):
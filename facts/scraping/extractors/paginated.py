@@ -0,0 +1,140 @@
+import contextvars
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
+from urllib.parse import urldefrag, urljoin
+
+from facts.scraping.extractors import BaseExtractor
+from facts.scraping.extractors.parsing import DEFAULT_PARSER, make_soup, process_html
+from facts.scraping.fetchers import (
+    BaseFetcher,
+    CachingFetcher,
+    DomainRateLimiter,
+    NotModified,
+    get_default_fetcher,
+    get_rate_limiter,
+)
+from facts.scraping.formatters import BaseFactFormatter, DefaultFactFormatter
+from facts.scraping.types import Fact as FactType
+
+logger = logging.getLogger(__name__)
+
+
+class BasePaginatedExtractor(BaseExtractor, ABC):
+    """
+    Base for sources spread over many pages.
+
+    ``url`` is an index page (pagination, sitemap, article listing) from which
+    ``_discover_pages`` returns the page URLs. Pages are fetched concurrently,
+    at most ``max_concurrency`` at a time and rate limited per domain, and each
+    page is parsed with ``_process_html`` as soon as it arrives, in the thread
+    that fetched it or in ``parse_executor``.
+
+    An unchanged index is read back from the cache and its pages are still
+    revalidated one by one; the source only counts as unchanged when none of
+    them changed either.
+    """
+
+    max_pages: int = 100
+    max_concurrency: int = 4
+    # Whether the index page itself lists facts
+    include_index_page: bool = False
+
+    def __init__(
+        self,
+        formatter: BaseFactFormatter = DefaultFactFormatter(),
+        fetcher: BaseFetcher | None = None,
+        parser: str = DEFAULT_PARSER,
+        rate_limiter: DomainRateLimiter | None = None,
+        parse_executor: Executor | None = None,
+    ) -> None:
+        self.formatter = formatter
+        self.fetcher = fetcher or get_default_fetcher()
+        self.parser = parser
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.parse_executor = parse_executor
+        # Pages processed successfully in the last run
+        self.page_urls: list[str] = []
+
+    @abstractmethod
+    def _discover_pages(self, html: str) -> Iterable[str]: ...
+
+    def _links(self, html: str, selector: str) -> list[str]:
+        """
+        Absolute URLs of the ``<a href>`` elements matching a CSS ``selector``.
+        """
+        soup = make_soup(html, None, self.parser)
+        return [
+            urldefrag(urljoin(self.url, link["href"])).url
+            for link in soup.select(selector)
+            if link.has_attr("href")
+        ]
+
+    def _fetch_page(self, url: str) -> str:
+        self.rate_limiter.wait(url)
+        logger.debug(f"Fetching {url}")
+        return self.fetcher.fetch(url)
+
+    def _fetch(self) -> str:
+        return self._fetch_page(self.url)
+
+    def _fetch_index(self) -> tuple[str, bool]:
+        """
+        The index page and whether it changed since the last run.
+        """
+        try:
+            return self._fetch(), True
+        except NotModified:
+            cached = None
+            if isinstance(self.fetcher, CachingFetcher):
+                cached = self.fetcher.cached(self.url)
+            if cached is None:
+                raise
+            logger.info(f"{self.url} unchanged, revalidating its pages")
+            return cached, False
+
+    def _load_page(self, url: str) -> list[FactType]:
+        html = self._fetch_page(url)
+        return list(process_html(self, html, self.parse_executor))
+
+    def _page_urls(self, index_html: str) -> list[str]:
+        urls = dict.fromkeys(
+            url for url in self._discover_pages(index_html) if url != self.url
+        )
+        return list(urls)[: self.max_pages]
+
+    def run(self) -> Iterator[FactType]:
+        index_html, index_changed = self._fetch_index()
+        urls = self._page_urls(index_html)
+        logger.info(f"Discovered {len(urls)} pages from {self.url}")
+
+        self.page_urls = []
+        unchanged = 0
+        if self.include_index_page and index_changed:
+            yield from process_html(self, index_html, self.parse_executor)
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            futures = {
+                executor.submit(
+                    contextvars.copy_context().run, self._load_page, url
+                ): url
+                for url in urls
+            }
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    facts = future.result()
+                except NotModified:
+                    logger.info(f"Skipping {url}, unchanged since last run")
+                    unchanged += 1
+                    continue
+                except Exception:
+                    logger.exception(f"Scraping page {url} failed")
+                    continue
+
+                self.page_urls.append(url)
+                yield from facts
+
+        if not index_changed and unchanged == len(urls):
+            raise NotModified(self.url)
@@ -0,0 +1,104 @@
+import multiprocessing
+from collections.abc import Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from html import escape
+from importlib.util import find_spec
+
+import django
+from bs4 import BeautifulSoup, Comment, NavigableString, SoupStrainer, Tag
+
+from facts.scraping.metrics import (
+    ScrapeMetrics,
+    current_metrics,
+    recording,
+    timed_iter,
+)
+from facts.scraping.types import Fact as FactType
+
+# BeautifulSoup tree builders, fastest first. lxml is a dependency, html.parser
+# (standard library) covers environments installed without it.
+PARSERS = ("lxml", "html.parser")
+
+KEPT_INLINE_TAGS = ("sup", "sub")
+
+# Extractor attributes ``_process_html`` may rely on in a parse worker process.
+# Fetchers, browsers and the like stay in the parent.
+PARSE_STATE = ("formatter", "parser")
+
+
+def available_parsers() -> list[str]:
+    return [
+        parser
+        for parser in PARSERS
+        if parser == "html.parser" or find_spec(parser) is not None
+    ]
+
+
+DEFAULT_PARSER = available_parsers()[0]
+
+
+def make_soup(html: str, parse_only: SoupStrainer | None, parser: str) -> BeautifulSoup:
+    if parser not in PARSERS:
+        raise ValueError(f"Unknown HTML parser '{parser}', expected one of {PARSERS}")
+    return BeautifulSoup(html, parser, parse_only=parse_only)
+
+
+def inline_html(tag: Tag, exclude: Tag | None = None) -> str:
+    """
+    Inner HTML of ``tag`` reduced to text plus ``<sup>``/``<sub>`` markup,
+    skipping ``exclude``. Built without mutating the parsed tree.
+    """
+    parts: list[str] = []
+    for child in tag.children:
+        if child is exclude or isinstance(child, Comment):
+            continue
+        if isinstance(child, NavigableString):
+            parts.append(escape(str(child), quote=False))
+        elif isinstance(child, Tag):
+            inner = inline_html(child, exclude)
+            if child.name in KEPT_INLINE_TAGS:
+                parts.append(f"<{child.name}>{inner}</{child.name}>")
+            else:
+                parts.append(inner)
+    return "".join(parts)
+
+
+def make_parse_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Process pool for ``process_html``. Workers are spawned rather than forked
+    because the parent runs fetcher and browser threads.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=django.setup,
+    )
+
+
+def _process_html_in_worker(
+    extractor_cls: type, state: dict, html: str
+) -> tuple[list[FactType], ScrapeMetrics]:
+    extractor = extractor_cls.__new__(extractor_cls)
+    extractor.__dict__.update(state)
+    with recording(ScrapeMetrics()) as metrics:
+        facts = list(timed_iter("parse", extractor._process_html(html)))
+    return facts, metrics
+
+
+def process_html(
+    extractor, html: str, executor: Executor | None = None
+) -> Iterator[FactType]:
+    """
+    Run ``extractor._process_html`` in the calling thread or, given an
+    ``executor``, in a worker process so CPU-bound parsing of many pages is not
+    serialized by the GIL. Only the ``PARSE_STATE`` attributes are sent along.
+    """
+    if executor is None:
+        return timed_iter("parse", extractor._process_html(html))
+
+    state = {name: getattr(extractor, name) for name in PARSE_STATE}
+    future = executor.submit(_process_html_in_worker, type(extractor), state, html)
+    facts, metrics = future.result()
+    if (parent_metrics := current_metrics()) is not None:
+        parent_metrics.merge(metrics)
+    return iter(facts)
@@ -1,10 +1,18 @@
 import logging
+from collections.abc import Iterator
+from concurrent.futures import Executor
 
-import requests
-from bs4 import BeautifulSoup, SoupStrainer, Tag
+from bs4 import SoupStrainer, Tag
 from django.utils.text import slugify
 
 from facts.scraping.extractors import BaseExtractor
+from facts.scraping.extractors.parsing import (
+    DEFAULT_PARSER,
+    inline_html,
+    make_soup,
+    process_html,
+)
+from facts.scraping.fetchers import BaseFetcher, get_default_fetcher
 from facts.scraping.formatters import BaseFactFormatter, DefaultFactFormatter
 from facts.scraping.types import Fact as FactType
 
@@ -14,28 +22,33 @@ logger = logging.getLogger(__name__)
 class ScienceFocus121FactsExtractor(BaseExtractor):
     url = "https://www.sciencefocus.com/science/fun-facts"
 
-    def __init__(self, formatter: BaseFactFormatter = DefaultFactFormatter()) -> None:
+    def __init__(
+        self,
+        formatter: BaseFactFormatter = DefaultFactFormatter(),
+        fetcher: BaseFetcher | None = None,
+        parser: str = DEFAULT_PARSER,
+        parse_executor: Executor | None = None,
+    ) -> None:
         self.formatter = formatter
+        self.fetcher = fetcher or get_default_fetcher()
+        self.parser = parser
+        self.parse_executor = parse_executor
 
     def _fetch(self) -> str:
         logger.info(f"Fetching {self.url}")
-        response = requests.get(self.url)
-        response.raise_for_status()
+        html = self.fetcher.fetch(self.url)
         logger.info(f"Fetched {self.url} successfully")
-        return response.text
+        return html
 
-    def _process_html(self, html: str) -> list[FactType]:
+    def _process_html(self, html: str) -> Iterator[FactType]:
         logger.info(f"Processing HTML for {self.url}")
 
         facts_ol = SoupStrainer("ol")
-        soup = BeautifulSoup(html, "html.parser", parse_only=facts_ol)
+        soup = make_soup(html, facts_ol, self.parser)
 
-        facts: list[FactType] = []
         for index, fact_html in enumerate(soup.find_all("li")):
-            logger.info(f"Processing fact #{index}")
-            facts.append(self._process_fact(fact_html))
-
-        return facts
+            logger.debug(f"Processing fact #{index}")
+            yield self._process_fact(fact_html)
 
     def _process_fact(self, fact_html: Tag) -> FactType:
         bold = fact_html.find(["b", "strong"])
@@ -43,16 +56,12 @@ class ScienceFocus121FactsExtractor(BaseExtractor):
             logger.warning("No bold tag found. Using text as fact instead")
             text = fact_html.get_text(" ", strip=True)
             fact_text, desc_text = self.formatter.format(text, "")
-            return FactType(fact=fact_text, description=desc_text)
+            return FactType(
+                fact=fact_text, identifier=slugify(fact_text), description=desc_text
+            )
 
         fact_text = bold.get_text(strip=True)
-        bold.extract()
-
-        for tag in fact_html.find_all(True):
-            if tag.name not in ("sup", "sub"):
-                tag.unwrap()
-
-        desc_html = fact_html.decode_contents().strip()
+        desc_html = inline_html(fact_html, exclude=bold).strip()
 
         fact_text, desc_html = self.formatter.format(fact_text, desc_html)
 
@@ -60,6 +69,6 @@ class ScienceFocus121FactsExtractor(BaseExtractor):
 
         return FactType(fact=fact_text, identifier=identifier, description=desc_html)
 
-    def run(self) -> list[FactType]:
+    def run(self) -> Iterator[FactType]:
         html = self._fetch()
-        return self._process_html(html)
+        yield from process_html(self, html, self.parse_executor)
@@ -0,0 +1,20 @@
+from .base import BaseFetcher, NotModified
+from .browser import BrowserPool, get_browser_pool
+from .cached import CachingFetcher
+from .rate_limit import DomainRateLimiter, get_rate_limiter
+from .requests_fetcher import RequestsFetcher, get_default_fetcher
+from .strategies import FetchStrategyStore, get_strategy_store
+
+__all__ = [
+    "BaseFetcher",
+    "BrowserPool",
+    "CachingFetcher",
+    "DomainRateLimiter",
+    "FetchStrategyStore",
+    "NotModified",
+    "RequestsFetcher",
+    "get_browser_pool",
+    "get_default_fetcher",
+    "get_rate_limiter",
+    "get_strategy_store",
+]
@@ -0,0 +1,16 @@
+from typing import Protocol, runtime_checkable
+
+
+@runtime_checkable
+class BaseFetcher(Protocol):
+    def fetch(self, url: str) -> str: ...
+
+
+class NotModified(Exception):
+    """
+    Raised when a source has not changed since it was last processed.
+    """
+
+    def __init__(self, url: str) -> None:
+        super().__init__(f"{url} has not changed since the last run")
+        self.url = url
@@ -0,0 +1,191 @@
+import atexit
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from urllib.parse import urlsplit
+
+from playwright.sync_api import Route, sync_playwright
+
+from facts.scraping.metrics import count, timed
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """
+    Long-lived headless Chromium shared by every extractor in the process.
+
+    Playwright's sync API is bound to the thread that started it, so the
+    browser lives on a dedicated worker thread and ``render`` calls from any
+    thread are queued to it. One browser and context are launched on first
+    use; the page is reused and recycled after ``max_page_uses`` navigations
+    or after an error. Images, fonts, media and known ad/analytics hosts are
+    blocked.
+    """
+
+    BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+    BLOCKED_HOSTS = (
+        "doubleclick.net",
+        "googlesyndication.com",
+        "googletagmanager.com",
+        "google-analytics.com",
+        "adservice.google.com",
+        "facebook.net",
+    )
+    LAUNCH_ARGS = ("--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu")
+
+    def __init__(
+        self,
+        wait_until: str = "domcontentloaded",
+        timeout: float = 20_000,
+        max_page_uses: int = 20,
+    ) -> None:
+        self.wait_until = wait_until
+        self.timeout = timeout
+        self.max_page_uses = max_page_uses
+
+        self._jobs: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+        # Only touched from the worker thread
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._page = None
+        self._page_uses = 0
+
+    @classmethod
+    def should_block(cls, resource_type: str, url: str) -> bool:
+        if resource_type in cls.BLOCKED_RESOURCE_TYPES:
+            return True
+        host = urlsplit(url).hostname or ""
+        return any(
+            host == blocked or host.endswith(f".{blocked}")
+            for blocked in cls.BLOCKED_HOSTS
+        )
+
+    def render(
+        self,
+        url: str,
+        wait_for_selector: str | None = None,
+        wait_until: str | None = None,
+    ) -> str:
+        """
+        Load ``url`` and return the rendered HTML once ``wait_until`` fired and
+        ``wait_for_selector`` (if any) is present.
+        """
+        self._ensure_started()
+        future: Future = Future()
+        self._jobs.put((future, url, wait_for_selector, wait_until or self.wait_until))
+        # Navigation and selector waits are each bounded by ``timeout``
+        with timed("fetch"):
+            html = future.result(timeout=3 * self.timeout / 1000)
+        count("bytes_downloaded", len(html.encode()))
+        return html
+
+    def close(self) -> None:
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None and thread.is_alive():
+            self._jobs.put(None)
+            thread.join(timeout=self.timeout / 1000)
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._serve, name="browser-pool", daemon=True
+                )
+                self._thread.start()
+
+    def _serve(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+
+            future, url, wait_for_selector, wait_until = job
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                page = self._get_page()
+                page.goto(url, wait_until=wait_until, timeout=self.timeout)
+                if wait_for_selector:
+                    page.wait_for_selector(wait_for_selector, timeout=self.timeout)
+                self._page_uses += 1
+                future.set_result(page.content())
+            except Exception as exc:
+                self._close_page()
+                future.set_exception(exc)
+
+        self._shutdown()
+
+    def _route(self, route: Route) -> None:
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            route.abort()
+        else:
+            route.continue_()
+
+    def _get_page(self):
+        if self._playwright is None:
+            self._playwright = sync_playwright().start()
+
+        if self._browser is None or not self._browser.is_connected():
+            logger.info("Launching headless Chromium")
+            self._page = None
+            self._browser = self._playwright.chromium.launch(
+                headless=True, args=list(self.LAUNCH_ARGS)
+            )
+            self._context = self._browser.new_context()
+            self._context.route("**/*", self._route)
+
+        if self._page is not None and self._page_uses >= self.max_page_uses:
+            self._close_page()
+
+        if self._page is None:
+            self._page = self._context.new_page()
+            self._page_uses = 0
+
+        return self._page
+
+    def _close_page(self) -> None:
+        if self._page is not None:
+            try:
+                self._page.close()
+            except Exception as exc:
+                logger.debug(f"Could not close page: {exc}")
+        self._page = None
+
+    def _shutdown(self) -> None:
+        self._close_page()
+        for resource, method in (
+            (self._context, "close"),
+            (self._browser, "close"),
+            (self._playwright, "stop"),
+        ):
+            if resource is not None:
+                try:
+                    getattr(resource, method)()
+                except Exception as exc:
+                    logger.debug(f"Could not {method} browser resource: {exc}")
+        self._context = self._browser = self._playwright = None
+
+
+_default_pool: BrowserPool | None = None
+_default_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """
+    Process-wide browser pool shared by extractors that are not given their own.
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = BrowserPool()
+            atexit.register(_default_pool.close)
+        return _default_pool
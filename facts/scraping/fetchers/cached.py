@@ -0,0 +1,115 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+from facts.scraping.fetchers.base import BaseFetcher, NotModified
+from facts.scraping.fetchers.requests_fetcher import RequestsFetcher
+from facts.scraping.metrics import count
+
+logger = logging.getLogger(__name__)
+
+
+class CachingFetcher(BaseFetcher):
+    """
+    Persistent on-disk response cache in front of a ``RequestsFetcher``.
+
+    Cached validators (``ETag``/``Last-Modified``) are sent back as
+    ``If-None-Match``/``If-Modified-Since``. On a 304 the source is unchanged:
+    ``NotModified`` is raised so the scraper skips parsing and storage, unless
+    ``skip_unchanged`` is off, in which case the cached body is returned.
+
+    New responses are only written to disk by ``commit``, once the facts
+    extracted from them were stored, so a failed run is retried in full.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        fetcher: RequestsFetcher | None = None,
+        skip_unchanged: bool = True,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.fetcher = fetcher or RequestsFetcher()
+        self.skip_unchanged = skip_unchanged
+        self._pending: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, url: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+    def _load(self, url: str) -> dict | None:
+        try:
+            with open(self._path(url), encoding="utf-8") as cache_file:
+                return json.load(cache_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Ignoring unreadable cache entry for {url}: {exc}")
+            return None
+
+    def cached(self, url: str) -> str | None:
+        """
+        Body last committed for ``url``, if any.
+        """
+        entry = self._load(url)
+        return None if entry is None else entry["body"]
+
+    def fetch(self, url: str) -> str:
+        entry = self._load(url)
+
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self.fetcher.get(url, headers=headers)
+
+        if response.status_code == 304 and entry is not None:
+            logger.info(f"{url} not modified since the last run")
+            count("not_modified")
+            if self.skip_unchanged:
+                raise NotModified(url)
+            return entry["body"]
+
+        body = response.text
+        with self._lock:
+            self._pending[url] = {
+                "url": url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "body": body,
+            }
+        return body
+
+    def discard(self, url: str) -> None:
+        """
+        Forget the pending response for ``url``, e.g. when its body was not
+        what ended up being processed.
+        """
+        with self._lock:
+            self._pending.pop(url, None)
+
+    def commit(self, urls: Iterable[str] | None = None) -> None:
+        """
+        Persist the pending responses for ``urls`` (all of them by default).
+        """
+        with self._lock:
+            urls = list(self._pending) if urls is None else list(urls)
+            entries = [self._pending.pop(url) for url in urls if url in self._pending]
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        for entry in entries:
+            if not entry["etag"] and not entry["last_modified"]:
+                continue
+
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                json.dump(entry, tmp_file)
+            os.replace(tmp_path, self._path(entry["url"]))
@@ -0,0 +1,40 @@
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+class DomainRateLimiter:
+    """
+    Spaces out requests to the same host by at least ``1 / requests_per_second``
+    seconds, across every thread sharing the limiter.
+    """
+
+    def __init__(self, requests_per_second: float = 2.0) -> None:
+        self.interval = 1 / requests_per_second
+        self._next_slot: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str) -> None:
+        host = urlsplit(url).hostname or ""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+
+        if slot > now:
+            time.sleep(slot - now)
+
+
+_default_limiter: DomainRateLimiter | None = None
+_default_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> DomainRateLimiter:
+    """
+    Process-wide limiter shared by extractors that are not given their own.
+    """
+    global _default_limiter
+    with _default_limiter_lock:
+        if _default_limiter is None:
+            _default_limiter = DomainRateLimiter()
+        return _default_limiter
@@ -0,0 +1,74 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+HTTP = "http"
+BROWSER = "browser"
+
+
+class FetchStrategyStore:
+    """
+    Remembers, per URL, whether plain HTTP or a browser produced usable HTML,
+    so later runs go straight to the strategy that worked.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path) if path is not None else None
+        self._lock = threading.Lock()
+        self._strategies: dict[str, str] | None = None
+
+    def _load(self) -> dict[str, str]:
+        if self._strategies is None:
+            self._strategies = {}
+            if self.path is not None:
+                try:
+                    with open(self.path, encoding="utf-8") as strategies_file:
+                        self._strategies = json.load(strategies_file)
+                except FileNotFoundError:
+                    pass
+                except (OSError, ValueError) as exc:
+                    logger.warning(f"Ignoring unreadable {self.path}: {exc}")
+        return self._strategies
+
+    def get(self, url: str) -> str | None:
+        with self._lock:
+            return self._load().get(url)
+
+    def set(self, url: str, strategy: str) -> None:
+        with self._lock:
+            strategies = self._load()
+            if strategies.get(url) == strategy:
+                return
+            strategies[url] = strategy
+            if self.path is None:
+                return
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                json.dump(strategies, tmp_file, indent=2)
+            os.replace(tmp_path, self.path)
+
+
+_default_store: FetchStrategyStore | None = None
+_default_store_lock = threading.Lock()
+
+
+def get_strategy_store() -> FetchStrategyStore:
+    """
+    Process-wide store persisted next to the scraping response cache.
+    """
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = FetchStrategyStore(
+                Path(settings.SCRAPING_CACHE_DIR) / "strategies.json"
+            )
+        return _default_store
@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+
+from facts.scraping.metrics import timed
 
 
 class BaseFactFormatter(ABC):
@@ -13,4 +16,14 @@ class BaseFactFormatter(ABC):
     def format_description(self, description: str) -> str: ...
 
     def format(self, title: str, description: str) -> tuple[str, str]:
-        return self.format_fact(title), self.format_description(description)
+        with timed("format"):
+            return self.format_fact(title), self.format_description(description)
+
+    def format_many(self, items: Iterable[tuple[str, str]]) -> list[tuple[str, str]]:
+        """Format a batch of ``(title, description)`` pairs."""
+        format_fact, format_description = self.format_fact, self.format_description
+        with timed("format"):
+            return [
+                (format_fact(title), format_description(description))
+                for title, description in items
+            ]
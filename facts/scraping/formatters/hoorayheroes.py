@@ -13,6 +13,7 @@ class HoorayHeroesFactFormatter(DefaultFactFormatter):
     """
 
     _LEADING_NUMBER = re.compile(r"^\s*\d+\s*-\s*")
+    _TRAILING_DOTS = re.compile(r"\.+\s*$")
     _EMOJI_CHARS = re.compile(
         "["  # Broad unicode ranges covering common emoji blocks
         "\U0001f300-\U0001faff"
@@ -26,7 +27,11 @@ class HoorayHeroesFactFormatter(DefaultFactFormatter):
         return self._LEADING_NUMBER.sub("", text)
 
     def _strip_trailing_dots(self, text: str) -> str:
-        return re.sub(r"\.+\s*$", "", text).rstrip()
+        text = text.rstrip()
+        # Saves the regex a scan of every dot in the string
+        if text.endswith("."):
+            text = self._TRAILING_DOTS.sub("", text).rstrip()
+        return text
 
     def _remove_emojis(self, text: str) -> str:
         return self._EMOJI_CHARS.sub("", text)
@@ -0,0 +1,161 @@
+"""
+Per-stage timings and counters of a scrape run.
+
+``Scraper`` activates its ``ScrapeMetrics`` with ``recording()`` and the
+fetchers, extractors, formatters and storages record into it through
+``timed()``, ``timed_iter()`` and ``count()``. Outside of a scrape those calls
+do nothing. Threads started during a scrape must be handed the context with
+``contextvars.copy_context().run``.
+"""
+
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+
+# ``parse`` includes the ``format`` time of the facts it yields.
+STAGES = ("fetch", "parse", "format", "store")
+
+
+@dataclass
+class StageStats:
+    calls: int = 0
+    seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.seconds / self.calls if self.calls else 0.0
+
+    def add(self, seconds: float, calls: int = 1) -> None:
+        self.calls += calls
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+
+class ScrapeMetrics:
+    """
+    Thread-safe accumulator of stage timings and named counters.
+    """
+
+    def __init__(self) -> None:
+        self.stages: dict[str, StageStats] = {stage: StageStats() for stage in STAGES}
+        self.counters: dict[str, int] = {}
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def add_time(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self.stages.setdefault(stage, StageStats()).add(seconds)
+
+    def add_count(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def merge(self, other: "ScrapeMetrics") -> None:
+        with self._lock:
+            for stage, stats in other.stages.items():
+                mine = self.stages.setdefault(stage, StageStats())
+                mine.calls += stats.calls
+                mine.seconds += stats.seconds
+                mine.max_seconds = max(mine.max_seconds, stats.max_seconds)
+            for name, value in other.counters.items():
+                self.counters[name] = self.counters.get(name, 0) + value
+
+    def as_dict(self) -> dict:
+        """
+        JSON-serializable report.
+        """
+        with self._lock:
+            return {
+                "elapsed_seconds": self.elapsed,
+                "stages": {
+                    stage: {**asdict(stats), "mean_seconds": stats.mean_seconds}
+                    for stage, stats in self.stages.items()
+                },
+                "counters": dict(sorted(self.counters.items())),
+            }
+
+
+_current: ContextVar[ScrapeMetrics | None] = ContextVar("scrape_metrics", default=None)
+
+
+def current_metrics() -> ScrapeMetrics | None:
+    return _current.get()
+
+
+@contextmanager
+def recording(metrics: ScrapeMetrics) -> Iterator[ScrapeMetrics]:
+    """
+    Record into ``metrics`` within the block.
+    """
+    token = _current.set(metrics)
+    start = time.perf_counter()
+    try:
+        yield metrics
+    finally:
+        metrics.elapsed += time.perf_counter() - start
+        _current.reset(token)
+
+
+class timed:
+    """
+    Context manager adding the time spent in the block to ``stage``.
+    """
+
+    __slots__ = ("stage", "metrics", "start")
+
+    def __init__(self, stage: str) -> None:
+        self.stage = stage
+        self.metrics = _current.get()
+
+    def __enter__(self) -> None:
+        if self.metrics is not None:
+            self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        if self.metrics is not None:
+            self.metrics.add_time(self.stage, time.perf_counter() - self.start)
+
+
+def timed_iter(stage: str, iterable: Iterable) -> Iterator:
+    """
+    Yield from ``iterable``, adding the time spent producing its items to
+    ``stage`` as a single call. Time spent by the consumer is not counted.
+    """
+    metrics = _current.get()
+    if metrics is None:
+        yield from iterable
+        return
+
+    iterator = iter(iterable)
+    seconds = 0.0
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                seconds += time.perf_counter() - start
+                return
+            seconds += time.perf_counter() - start
+            yield item
+    finally:
+        metrics.add_time(stage, seconds)
+
+
+def count(name: str, value: int = 1) -> None:
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.add_count(name, value)
@@ -1,25 +1,167 @@
+import contextvars
 import logging
+import queue
+import threading
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 
+from facts.scraping.dedupe import NearDuplicateFilter
 from facts.scraping.extractors import BaseExtractor as Extractor
+from facts.scraping.fetchers import NotModified
+from facts.scraping.metrics import ScrapeMetrics, recording
 from facts.scraping.storage import BaseStorage as Storage
+from facts.scraping.types import DeleteResult, Fact as FactType, SaveResult
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Marks the end of one extractor's stream in the facts queue
+_DONE = object()
+
 
 class Scraper:
-    def __init__(self, extractor: Extractor, storage: Storage):
-        self.extractor = extractor
+    def __init__(
+        self,
+        extractor: Extractor | Sequence[Extractor],
+        storage: Storage,
+        max_workers: int = 4,
+        queue_size: int = 1000,
+        dedupe: NearDuplicateFilter | None = None,
+        metrics: ScrapeMetrics | None = None,
+    ):
+        self.extractors: list[Extractor] = (
+            list(extractor) if isinstance(extractor, Sequence) else [extractor]
+        )
         self.storage = storage
+        self.max_workers = max_workers
+        self.queue_size = queue_size
+        self.dedupe = dedupe
+        self.metrics = metrics or ScrapeMetrics()
+        self.failed: list[Extractor] = []
+        self.unchanged: list[Extractor] = []
+        # Ran without errors but yielded nothing, e.g. an unrendered page
+        self.empty: list[Extractor] = []
+        self.extracted = 0
+
+    def _produce(
+        self, extractor: Extractor, facts: queue.Queue, stop: threading.Event
+    ) -> None:
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    facts.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        count = 0
+        try:
+            for fact in extractor.run():
+                if not put(fact):
+                    return
+                count += 1
+        except NotModified:
+            logger.info(f"Skipping {extractor.url}, unchanged since last run")
+            self.unchanged.append(extractor)
+        except Exception:
+            logger.exception(f"Scraping {extractor.url} failed")
+            self.failed.append(extractor)
+        else:
+            if count:
+                logger.info(f"Extracted {count} facts from {extractor.url}")
+            else:
+                logger.warning(f"No facts found at {extractor.url}")
+                self.empty.append(extractor)
+        finally:
+            put(_DONE)
+
+    def _extract(self) -> Iterator[FactType]:
+        """
+        Stream facts from every extractor, run on a bounded thread pool,
+        skipping identifiers that were already yielded.
+
+        Facts go through a bounded queue so that storage consumes them while
+        extractors are still parsing and memory stays flat.
+        """
+        self.failed = []
+        self.unchanged = []
+        self.empty = []
+        self.extracted = 0
+
+        facts: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        workers = max(1, min(self.max_workers, len(self.extractors)))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for extractor in self.extractors:
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._produce,
+                    extractor,
+                    facts,
+                    stop,
+                )
+
+            try:
+                remaining = len(self.extractors)
+                seen: set[str] = set()
+                while remaining:
+                    fact = facts.get()
+                    if fact is _DONE:
+                        remaining -= 1
+                    elif fact.identifier not in seen:
+                        seen.add(fact.identifier)
+                        self.extracted += 1
+                        yield fact
+            finally:
+                # Unblock producers if storage stopped consuming early
+                stop.set()
+
+    def _count(self, result: SaveResult | DeleteResult) -> None:
+        counters = {
+            "facts_extracted": self.extracted,
+            "extractors_failed": len(self.failed),
+            "extractors_unchanged": len(self.unchanged),
+            "extractors_empty": len(self.empty),
+        }
+        if isinstance(result, DeleteResult):
+            counters.update(deleted=result.deleted, missing=len(result.missing))
+        else:
+            counters.update(
+                created=result.created,
+                updated=result.updated,
+                unchanged=result.unchanged,
+            )
+            if self.dedupe is not None:
+                counters["near_duplicates"] = len(self.dedupe.duplicates)
+
+        for name, value in counters.items():
+            self.metrics.add_count(name, value)
+
+    def scrape(self, delete: bool = False) -> SaveResult | DeleteResult:
+        """
+        Extract facts and save (or delete) them, recording per-stage timings
+        and counters in ``self.metrics``.
+        """
+        for extractor in self.extractors:
+            logger.info(f"Scraping {extractor.url}")
 
-    def scrape(self, delete: bool = False):
-        logger.info(f"Scraping {self.extractor.url}")
-        facts = self.extractor.run()
-        logger.info(f"Extracted {len(facts)} facts")
+        # Closing the stream stops the producers when storage raises partway
+        with recording(self.metrics), closing(self._extract()) as extracted:
+            if delete:
+                result = self.storage.delete(extracted)
+            else:
+                facts = extracted
+                if self.dedupe is not None:
+                    facts = self.dedupe.filter(facts)
+                result = self.storage.save(facts)
 
+        self._count(result)
+        logger.info(f"Extracted {self.extracted} facts")
         if delete:
-            self.storage.delete(facts)
-            logger.info(f"Deleted {len(facts)} facts")
+            logger.info(f"Deleted {result.deleted} facts")
         else:
-            self.storage.save(facts)
-            logger.info(f"Saved {len(facts)} facts")
+            logger.info(f"Saved {self.extracted} facts")
+        return result
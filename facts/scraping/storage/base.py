@@ -1,12 +1,13 @@
+from collections.abc import Iterable
 from typing import Protocol, runtime_checkable
 
-from facts.scraping.types import Fact as FactType
+from facts.scraping.types import DeleteResult, Fact as FactType, SaveResult
 
 
 @runtime_checkable
 class BaseStorage(Protocol):
-    def __init__(self, override: bool): ...
+    def __init__(self, override: bool, chunk_size: int): ...
 
-    def save(self, facts: list[FactType]) -> None: ...
+    def save(self, facts: Iterable[FactType]) -> SaveResult: ...
 
-    def delete(self, facts: list[FactType]) -> None: ...
+    def delete(self, facts: Iterable[FactType]) -> DeleteResult: ...
@@ -1,47 +1,202 @@
 import logging
+from collections.abc import Iterable, Iterator
+from itertools import islice
 
+from django.db import transaction
+from django.utils import timezone
+
+from facts.cache import bump_catalog_version
 from facts.models import Fact
+from facts.scraping.dedupe import fact_signature
+from facts.scraping.metrics import timed
 from facts.scraping.storage.base import BaseStorage
-from facts.scraping.types import Fact as FactType
+from facts.scraping.types import DeleteResult, Fact as FactType, SaveResult
 
 logger = logging.getLogger(__name__)
 
+# Stays below SQLite's limit on bound variables per query.
+BATCH_SIZE = 500
+
+
+def _chunks(items: Iterable, size: int = BATCH_SIZE) -> Iterator[list]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
 
 class DBStorage(BaseStorage):
-    def __init__(self, override: bool = False):
+    """
+    Stores facts in the database, consuming them in chunks of ``chunk_size``
+    so that a stream of facts is written while it is still being produced.
+    Each chunk is written in its own transaction.
+
+    Changes bump the catalog version, which retires the cached daily pages,
+    unless ``bump_version`` is off (e.g. for a throwaway benchmark database).
+    """
+
+    def __init__(
+        self,
+        override: bool = False,
+        chunk_size: int = BATCH_SIZE,
+        bump_version: bool = True,
+    ):
         self.override = override
+        self.chunk_size = chunk_size
+        self.bump_version = bump_version
 
-    def save(self, facts: list[FactType]) -> None:
-        for index, fact in enumerate(facts):
-            fact_obj, created = Fact.objects.get_or_create(
-                identifier=fact.identifier,
-                defaults={
-                    "fact": fact.fact,
-                    "description": fact.description,
-                },
-            )
-
-            if created:
-                fact_obj.save()
-                logger.info(f"Saved fact #{index}")
-            else:
-                if self.override:
-                    fact_obj.fact = fact.fact
-                    fact_obj.description = fact.description
-                    fact_obj.save()
-                    logger.info(f"Updated fact #{index}")
-                else:
-                    logger.info(
-                        "Fact #%s already exists:\n - %s",
-                        index,
-                        fact_obj.fact,
+    def _unique(self, facts: Iterable[FactType]) -> dict[str, FactType]:
+        """
+        Index facts by identifier. The last duplicate wins when overriding,
+        the first one otherwise.
+        """
+        unique: dict[str, FactType] = {}
+        for fact in facts:
+            if self.override or fact.identifier not in unique:
+                unique[fact.identifier] = fact
+        return unique
+
+    def _save_chunk(self, facts: list[FactType], result: SaveResult) -> None:
+        """
+        Insert new facts and, when overriding, update the ones whose content
+        hash changed. Existing rows are compared by hash without loading their
+        text.
+
+        Existing rows are looked up before the transaction starts, so that
+        positions can be locked before anything else is read inside it.
+        """
+        unique = self._unique(facts)
+
+        with timed("store"):
+            existing: dict[str, tuple[int, str]] = {}
+            for identifiers in _chunks(unique):
+                existing.update(
+                    (identifier, (pk, content_hash))
+                    for identifier, pk, content_hash in Fact.objects.filter(
+                        identifier__in=identifiers
+                    ).values_list("identifier", "pk", "content_hash")
+                )
+
+            new_objs: list[Fact] = []
+            changed_objs: list[Fact] = []
+            now = timezone.now()
+
+            for identifier, fact in unique.items():
+                content_hash = Fact.compute_content_hash(fact.fact, fact.description)
+                if identifier not in existing:
+                    new_objs.append(
+                        Fact(
+                            identifier=identifier,
+                            fact=fact.fact,
+                            description=fact.description,
+                            content_hash=content_hash,
+                            dedupe_signature=fact_signature(
+                                fact.fact, fact.description
+                            ),
+                        )
+                    )
+                    continue
+
+                pk, existing_hash = existing[identifier]
+                if self.override and content_hash != existing_hash:
+                    changed_objs.append(
+                        Fact(
+                            pk=pk,
+                            identifier=identifier,
+                            fact=fact.fact,
+                            description=fact.description,
+                            content_hash=content_hash,
+                            dedupe_signature=fact_signature(
+                                fact.fact, fact.description
+                            ),
+                            updated_at=now,
+                        )
                     )
+                else:
+                    logger.debug("Fact %s left unchanged", identifier)
+                    result.unchanged += 1
+
+            with transaction.atomic():
+                if new_objs:
+                    Fact.lock_positions()
+                    start = Fact.next_position()
+                    for position, obj in enumerate(new_objs, start):
+                        obj.position = position
+                Fact.objects.bulk_create(new_objs, batch_size=BATCH_SIZE)
+                Fact.objects.bulk_update(
+                    changed_objs,
+                    [
+                        "fact",
+                        "description",
+                        "content_hash",
+                        "dedupe_signature",
+                        "updated_at",
+                    ],
+                    batch_size=BATCH_SIZE,
+                )
+
+        result.created += len(new_objs)
+        result.updated += len(changed_objs)
+        result.created_identifiers.extend(obj.identifier for obj in new_objs)
+        result.updated_identifiers.extend(obj.identifier for obj in changed_objs)
+
+    def save(self, facts: Iterable[FactType]) -> SaveResult:
+        result = SaveResult()
+
+        # Chunks commit one by one, so whatever was committed before an error
+        # still has to retire the cached pages
+        try:
+            for chunk in _chunks(facts, self.chunk_size):
+                self._save_chunk(chunk, result)
+                logger.debug(f"Saved a chunk of {len(chunk)} facts")
+        finally:
+            if self.bump_version and (result.created or result.updated):
+                bump_catalog_version()
+
+        logger.info(
+            "Saved facts: %s created, %s updated, %s unchanged",
+            result.created,
+            result.updated,
+            result.unchanged,
+        )
+
+        return result
+
+    def delete(self, facts: Iterable[FactType]) -> DeleteResult:
+        result = DeleteResult()
+        seen: set[str] = set()
+
+        try:
+            for chunk in _chunks(facts, self.chunk_size):
+                identifiers = [
+                    fact.identifier for fact in chunk if fact.identifier not in seen
+                ]
+                identifiers = list(dict.fromkeys(identifiers))
+                seen.update(identifiers)
+
+                with timed("store"), transaction.atomic():
+                    found: set[str] = set()
+                    for batch in _chunks(identifiers):
+                        existing = Fact.objects.filter(identifier__in=batch)
+                        found.update(existing.values_list("identifier", flat=True))
+                        existing.delete()
+
+                result.deleted += len(found)
+                result.missing.extend(
+                    identifier for identifier in identifiers if identifier not in found
+                )
+
+            with timed("store"):
+                Fact.compact_positions()
+        finally:
+            if self.bump_version and result.deleted:
+                bump_catalog_version()
+
+        for identifier in result.missing:
+            logger.warning(f"Fact {identifier} not found")
+        logger.info(
+            "Deleted facts: %s deleted, %s missing",
+            result.deleted,
+            len(result.missing),
+        )
 
-    def delete(self, facts: list[FactType]) -> None:
-        for index, fact in enumerate(facts):
-            try:
-                fact_obj = Fact.objects.get(identifier=fact.identifier)
-                fact_obj.delete()
-                logger.info(f"Deleted fact {fact.identifier} (#{index})")
-            except Fact.DoesNotExist:
-                logger.warning(f"Fact {fact.identifier} (#{index}) not found")
+        return result
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -6,3 +6,18 @@ class Fact:
     fact: str
     identifier: str
     description: str
+
+
+@dataclass
+class SaveResult:
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    created_identifiers: list[str] = field(default_factory=list, compare=False)
+    updated_identifiers: list[str] = field(default_factory=list, compare=False)
+
+
+@dataclass
+class DeleteResult:
+    deleted: int = 0
+    missing: list[str] = field(default_factory=list)
@@ -1,2 +1,1076 @@
+import datetime
+import json
+import tempfile
+import threading
+from io import StringIO
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import IntegrityError, connection, connections
+from django.db.models import F
+from django.test import (
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+    skipUnlessDBFeature,
+)
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils.text import slugify
+
+from .cache import get_catalog_version, seconds_until_midnight
+from .management.commands.scrape_facts import _seed_near_duplicates
+from .models import CatalogVersion, Fact, FactSchedule
+from .scraping.benchmark import (
+    BenchmarkResult,
+    compare,
+    run_benchmark,
+    snapshot_path,
+)
+from .scraping.dedupe import NearDuplicateFilter, fact_signature
+from .scraping.extractors import (
+    BasePaginatedExtractor,
+    HooRayHeroesAnimalsFunFactsExtractor,
+    ScienceFocus121FactsExtractor,
+    TodayInterestingFactsAdultsExtractor,
+)
+from .scraping.extractors.parsing import available_parsers, make_parse_pool
+from .scraping.fetchers import (
+    BrowserPool,
+    CachingFetcher,
+    DomainRateLimiter,
+    FetchStrategyStore,
+    NotModified,
+    RequestsFetcher,
+)
+from .scraping.formatters import DefaultFactFormatter, HoorayHeroesFactFormatter
+from .scraping.metrics import ScrapeMetrics, recording
+from .scraping.scraper import Scraper
+from .scraping.storage import DBStorage
+from .scraping.types import DeleteResult, Fact as FactType, SaveResult
+
+
+def make_facts(count: int, prefix: str = "fact") -> list[FactType]:
+    return [
+        FactType(
+            fact=f"{prefix} {index}",
+            identifier=f"{prefix}-{index}",
+            description=f"Description {index}.",
+        )
+        for index in range(count)
+    ]
+
+
+class FactPositionTests(TestCase):
+    def test_positions_are_assigned_densely_on_save(self):
+        DBStorage().save(make_facts(5))
+
+        self.assertEqual(
+            list(Fact.objects.order_by("position").values_list("position", flat=True)),
+            [0, 1, 2, 3, 4],
+        )
+
+    def test_positions_stay_dense_after_delete(self):
+        facts = make_facts(6)
+        DBStorage().save(facts)
+
+        DBStorage().delete([facts[1], facts[3]])
+
+        self.assertEqual(
+            sorted(Fact.objects.values_list("position", flat=True)), [0, 1, 2, 3]
+        )
+
+    def test_fact_from_date_is_stable(self):
+        DBStorage().save(make_facts(10))
+        date = datetime.date(2026, 1, 1)
+
+        first = Fact.get_fact_from_date(date)
+        with self.assertNumQueries(3):
+            second = Fact.get_fact_from_date(date)
+
+        self.assertIsNotNone(first)
+        self.assertEqual(first, second)
+
+    def test_fact_from_date_skips_gaps_left_by_plain_deletes(self):
+        DBStorage().save(make_facts(10))
+        date = datetime.date(2026, 1, 2)
+        self.assertEqual(Fact.get_fact_from_date(date).identifier, "fact-3")
+
+        Fact.objects.filter(identifier="fact-3").delete()
+
+        self.assertEqual(Fact.get_fact_from_date(date).identifier, "fact-4")
+
+    def test_fact_from_date_without_facts(self):
+        self.assertIsNone(Fact.get_fact_from_date(datetime.date(2026, 1, 1)))
+
+
+@skipUnlessDBFeature("has_select_for_update")
+class ConcurrentPositionTests(TransactionTestCase):
+    def test_concurrent_writers_get_distinct_positions(self):
+        start = threading.Barrier(4)
+        errors: list[Exception] = []
+
+        def write(prefix: str) -> None:
+            try:
+                start.wait()
+                DBStorage(chunk_size=1).save(make_facts(5, prefix))
+                for index in range(5):
+                    Fact(
+                        identifier=f"{prefix}-single-{index}",
+                        fact=f"{prefix} single {index}",
+                        description="Saved one by one.",
+                    ).save()
+            except Exception as error:
+                errors.append(error)
+            finally:
+                connections.close_all()
+
+        threads = [
+            threading.Thread(target=write, args=(f"writer{index}",))
+            for index in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(
+            sorted(Fact.objects.values_list("position", flat=True)), list(range(40))
+        )
+
+
+class RandomFactViewCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_page_is_served_from_cache(self):
+        DBStorage().save(make_facts(3))
+        url = reverse("facts:random-fact")
+        first = self.client.get(url)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(url)
+
+        self.assertEqual(first.content, second.content)
+
+    def test_storage_changes_invalidate_cached_page(self):
+        url = reverse("facts:random-fact")
+        self.assertContains(self.client.get(url), "no fact for today")
+
+        DBStorage().save(make_facts(1))
+
+        self.assertContains(self.client.get(url), "fact 0")
+
+    @override_settings(SINGLETON_REVALIDATE_SECONDS=0)
+    def test_changes_from_other_processes_invalidate_cached_page(self):
+        url = reverse("facts:random-fact")
+        self.assertContains(self.client.get(url), "no fact for today")
+
+        # What a scrape_facts process leaves behind: new rows and a new
+        # version, but nothing in this process's cache
+        Fact.objects.create(identifier="fact-0", fact="fact 0", description="")
+        CatalogVersion.objects.update(version=F("version") + 1)
+
+        self.assertContains(self.client.get(url), "fact 0")
+
+    def test_seconds_until_midnight(self):
+        now = datetime.datetime(2026, 1, 1, 23, 59, 30, tzinfo=datetime.timezone.utc)
+        self.assertEqual(seconds_until_midnight(now), 30)
+
+
+class RandomFactViewConditionalTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        DBStorage().save(make_facts(3))
+
+    def test_response_has_validators_and_max_age(self):
+        response = self.client.get(reverse("facts:random-fact"))
+
+        self.assertTrue(response.has_header("ETag"))
+        self.assertFalse(response["ETag"].startswith("W/"))
+        self.assertTrue(response.has_header("Last-Modified"))
+        self.assertRegex(response["Cache-Control"], r"max-age=\d+")
+
+    def test_matching_etag_returns_not_modified(self):
+        url = reverse("facts:random-fact")
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, headers={"if-none-match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+
+
+class FactScheduleTests(TestCase):
+    def setUp(self):
+        DBStorage().save(make_facts(10))
+
+    def test_schedule_matches_live_selection(self):
+        start = datetime.date(2026, 1, 1)
+        call_command("schedule_facts", days=30, start=start, stdout=StringIO())
+
+        self.assertEqual(FactSchedule.objects.count(), 30)
+        for entry in FactSchedule.objects.select_related("fact"):
+            self.assertEqual(entry.fact, Fact.pick_fact_from_date(entry.date))
+
+    def test_scheduled_days_survive_new_facts(self):
+        date = datetime.date(2026, 1, 1)
+        call_command("schedule_facts", days=1, start=date, stdout=StringIO())
+        scheduled = Fact.get_fact_from_date(date)
+
+        DBStorage().save(make_facts(5, prefix="new"))
+
+        with self.assertNumQueries(1):
+            self.assertEqual(Fact.get_fact_from_date(date), scheduled)
+
+    def test_schedule_matches_live_selection_with_gaps(self):
+        Fact.objects.filter(identifier__in=["fact-3", "fact-7"]).delete()
+        start = datetime.date(2026, 1, 1)
+        call_command("schedule_facts", days=30, start=start, stdout=StringIO())
+
+        self.assertEqual(FactSchedule.objects.count(), 30)
+        for entry in FactSchedule.objects.select_related("fact"):
+            self.assertEqual(entry.fact, Fact.pick_fact_from_date(entry.date))
+
+    def test_missing_day_falls_back_to_live_selection(self):
+        date = datetime.date(2026, 1, 1)
+        self.assertEqual(Fact.get_fact_from_date(date), Fact.pick_fact_from_date(date))
+
+
+# Run against Postgres as well with DB_ENGINE=postgres (see settings)
+class BackendParityTests(TestCase):
+    def indexed_columns(self, model) -> set[tuple[str, ...]]:
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, model._meta.db_table
+            )
+        return {
+            tuple(constraint["columns"])
+            for constraint in constraints.values()
+            if constraint["index"] or constraint["unique"]
+        }
+
+    def test_date_selection_is_the_same_on_every_backend(self):
+        DBStorage().save(make_facts(10))
+        start = datetime.date(2026, 1, 1)
+        days = [start + datetime.timedelta(days=offset) for offset in range(5)]
+        expected = ["fact-0", "fact-3", "fact-4", "fact-4", "fact-3"]
+
+        live = [Fact.get_fact_from_date(day).identifier for day in days]
+        call_command("schedule_facts", days=5, start=start, stdout=StringIO())
+        scheduled = [Fact.get_fact_from_date(day).identifier for day in days]
+
+        self.assertEqual(live, expected)
+        self.assertEqual(scheduled, expected)
+
+    def test_compaction_moves_unpositioned_facts_last(self):
+        DBStorage().save(make_facts(6))
+        Fact.objects.filter(identifier__in=["fact-1", "fact-3"]).delete()
+        Fact.objects.filter(identifier="fact-5").update(position=None)
+
+        Fact.compact_positions()
+
+        self.assertEqual(
+            list(
+                Fact.objects.order_by("position").values_list("identifier", flat=True)
+            ),
+            ["fact-0", "fact-4", "fact-2", "fact-5"],
+        )
+
+    def test_hot_paths_are_indexed(self):
+        categories = Fact.categories.through
+
+        self.assertLessEqual(
+            {("created_at",), ("position",)}, self.indexed_columns(Fact)
+        )
+        self.assertIn(("date",), self.indexed_columns(FactSchedule))
+        self.assertIn(("category_id",), self.indexed_columns(categories))
+
+
+class DBStorageSaveTests(TestCase):
+    def test_bulk_save_uses_a_handful_of_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            result = DBStorage().save(make_facts(1200))
+
+        self.assertLess(len(queries), 35)
+        self.assertEqual(result, SaveResult(created=1200))
+        self.assertEqual(Fact.objects.count(), 1200)
+
+    def test_existing_facts_are_kept_without_override(self):
+        facts = make_facts(3)
+        DBStorage().save(facts)
+        facts[0].description = "Changed."
+
+        result = DBStorage().save(facts + make_facts(1, prefix="new"))
+
+        self.assertEqual(result, SaveResult(created=1, unchanged=3))
+        self.assertEqual(
+            Fact.objects.get(identifier="fact-0").description, "Description 0."
+        )
+
+    def test_override_updates_only_changed_facts(self):
+        facts = make_facts(3)
+        DBStorage().save(facts)
+        facts[0].description = "Changed."
+
+        result = DBStorage(override=True).save(facts)
+
+        self.assertEqual(result, SaveResult(updated=1, unchanged=2))
+        self.assertEqual(Fact.objects.get(identifier="fact-0").description, "Changed.")
+
+    def test_override_of_unchanged_facts_writes_nothing(self):
+        facts = make_facts(3)
+        DBStorage().save(facts)
+        updated_at = Fact.objects.get(identifier="fact-0").updated_at
+
+        with CaptureQueriesContext(connection) as queries:
+            result = DBStorage(override=True).save(facts)
+
+        self.assertEqual(result, SaveResult(unchanged=3))
+        self.assertFalse(
+            any(query["sql"].startswith("UPDATE") for query in queries.captured_queries)
+        )
+        self.assertEqual(Fact.objects.get(identifier="fact-0").updated_at, updated_at)
+
+    def test_committed_chunks_bump_the_version_when_a_later_one_fails(self):
+        def facts():
+            yield from make_facts(3)
+            raise ConnectionError("source went away")
+
+        version = get_catalog_version()
+
+        with self.assertRaises(ConnectionError):
+            DBStorage(chunk_size=2).save(facts())
+
+        self.assertEqual(Fact.objects.count(), 2)
+        self.assertNotEqual(get_catalog_version(), version)
+
+    def test_save_reports_changed_identifiers(self):
+        facts = make_facts(2)
+        DBStorage().save(facts[:1])
+        facts[0].fact = "Changed"
+
+        result = DBStorage(override=True).save(facts)
+
+        self.assertEqual(result.created_identifiers, ["fact-1"])
+        self.assertEqual(result.updated_identifiers, ["fact-0"])
+        self.assertEqual(
+            Fact.objects.get(identifier="fact-0").content_hash,
+            Fact.compute_content_hash("Changed", "Description 0."),
+        )
+
+
+class DBStorageDeleteTests(TestCase):
+    def test_bulk_delete_reports_missing_identifiers(self):
+        facts = make_facts(4)
+        DBStorage().save(facts[:3])
+
+        result = DBStorage().delete(facts[1:])
+
+        self.assertEqual(result, DeleteResult(deleted=2, missing=["fact-3"]))
+        self.assertEqual(
+            list(Fact.objects.values_list("identifier", flat=True)), ["fact-0"]
+        )
+
+    def test_bulk_delete_uses_a_handful_of_queries(self):
+        facts = make_facts(1200)
+        DBStorage().save(facts)
+
+        with CaptureQueriesContext(connection) as queries:
+            result = DBStorage().delete(facts)
+
+        self.assertLess(len(queries), 40)
+        self.assertEqual(result.deleted, 1200)
+        self.assertFalse(Fact.objects.exists())
+
+
+class StaticExtractor:
+    def __init__(self, url: str, facts: list[FactType] | None = None) -> None:
+        self.url = url
+        self.facts = facts
+
+    def run(self) -> list[FactType]:
+        if self.facts is None:
+            raise ConnectionError(self.url)
+        return self.facts
+
+
+class ScraperTests(TestCase):
+    def test_merges_extractors_and_skips_failures(self):
+        first = StaticExtractor("https://a.example", make_facts(3))
+        second = StaticExtractor("https://b.example", make_facts(5))
+        broken = StaticExtractor("https://c.example")
+        scraper = Scraper(extractor=[first, second, broken], storage=DBStorage())
+
+        result = scraper.scrape()
+
+        self.assertEqual(result, SaveResult(created=5))
+        self.assertEqual(scraper.failed, [broken])
+
+    def test_extractors_without_facts_are_reported_as_empty(self):
+        full = StaticExtractor("https://a.example", make_facts(3))
+        empty = StaticExtractor("https://b.example", [])
+        scraper = Scraper(extractor=[full, empty], storage=DBStorage())
+
+        scraper.scrape()
+
+        self.assertEqual(scraper.failed, [])
+        self.assertEqual(scraper.empty, [empty])
+        self.assertEqual(scraper.metrics.counters["extractors_empty"], 1)
+
+
+class FailingStorage:
+    def __init__(self, fail_after: int) -> None:
+        self.fail_after = fail_after
+
+    def save(self, facts) -> SaveResult:
+        for index, _ in enumerate(facts):
+            if index == self.fail_after:
+                raise IntegrityError("storage failed")
+        return SaveResult()
+
+
+class ScraperStorageFailureTests(TestCase):
+    def test_producers_stop_when_storage_raises(self):
+        closed = threading.Event()
+
+        class EndlessExtractor:
+            url = "https://a.example"
+
+            def run(self):
+                try:
+                    yield from make_facts(5000)
+                finally:
+                    closed.set()
+
+        scraper = Scraper(
+            extractor=EndlessExtractor(),
+            storage=FailingStorage(fail_after=10),
+            queue_size=10,
+        )
+
+        try:
+            scraper.scrape()
+        except IntegrityError as exc:
+            # Keeps the traceback, and with it the stream, alive like a caller
+            # logging the error would
+            error = exc
+        else:
+            self.fail("The storage error was not raised")
+
+        self.assertTrue(closed.wait(timeout=5))
+        self.assertIsNotNone(error.__traceback__)
+
+
+class ScraperMetricsTests(TestCase):
+    def test_records_stage_timings_and_counters(self):
+        url = TodayInterestingFactsAdultsExtractor.url
+        html = (
+            '<ul class="break-above body-ul body-list-el">'
+            "<li>Octopuses have three hearts.</li><li>Honey never spoils</li></ul>"
+        )
+        extractor = TodayInterestingFactsAdultsExtractor(
+            fetcher=StaticFetcher({url: html})
+        )
+        scraper = Scraper(extractor=extractor, storage=DBStorage())
+
+        scraper.scrape()
+
+        report = scraper.metrics.as_dict()
+        self.assertEqual(report["stages"]["parse"]["calls"], 1)
+        self.assertEqual(report["stages"]["format"]["calls"], 2)
+        self.assertEqual(report["stages"]["store"]["calls"], 1)
+        self.assertEqual(report["counters"]["facts_extracted"], 2)
+        self.assertEqual(report["counters"]["created"], 2)
+        self.assertGreater(report["elapsed_seconds"], 0)
+        json.dumps(report)
+
+
+class StaticFetcher:
+    def __init__(self, pages: dict[str, str]) -> None:
+        self.pages = pages
+
+    def fetch(self, url: str) -> str:
+        return self.pages[url]
+
+
+class ScrapeFactsCommandTests(TestCase):
+    def test_report_on_stdout_is_the_only_output_there(self):
+        html = (
+            '<ul class="break-above body-ul body-list-el">'
+            "<li>Octopuses have three hearts.</li></ul>"
+        )
+        stdout, stderr = StringIO(), StringIO()
+
+        with mock.patch.object(RequestsFetcher, "fetch", return_value=html):
+            call_command(
+                "scrape_facts",
+                "TodayInterestingFactsAdultsExtractor",
+                "DBStorage",
+                no_cache=True,
+                report="-",
+                stdout=stdout,
+                stderr=stderr,
+            )
+
+        report = json.loads(stdout.getvalue())
+        self.assertEqual(report["counters"]["created"], 1)
+        self.assertIn("1 created", stderr.getvalue())
+
+
+class ExtractorFetcherTests(TestCase):
+    def test_extractor_fetches_through_its_fetcher(self):
+        url = TodayInterestingFactsAdultsExtractor.url
+        html = (
+            '<ul class="break-above body-ul body-list-el">'
+            "<li>Octopuses have three hearts.</li></ul>"
+        )
+        extractor = TodayInterestingFactsAdultsExtractor(
+            fetcher=StaticFetcher({url: html})
+        )
+
+        facts = list(extractor.run())
+
+        self.assertEqual(
+            facts,
+            [
+                FactType(
+                    fact="Octopuses have three hearts",
+                    identifier="octopuses-have-three-hearts",
+                    description="",
+                )
+            ],
+        )
+
+
+class RevalidatingFetcher:
+    """
+    Answers 304 whenever the request carries the page's ETag.
+    """
+
+    def __init__(self, body: str, etag: str) -> None:
+        self.body = body
+        self.etag = etag
+        self.requests: list[dict] = []
+
+    def get(self, url, headers=None):
+        self.requests.append(headers or {})
+        if (headers or {}).get("If-None-Match") == self.etag:
+            return SimpleNamespace(status_code=304, headers={}, text="")
+        return SimpleNamespace(
+            status_code=200, headers={"ETag": self.etag}, text=self.body
+        )
+
+
+class CachingFetcherTests(TestCase):
+    url = "https://a.example/facts"
+
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        self.origin = RevalidatingFetcher("<p>facts</p>", '"v1"')
+
+    def test_unchanged_source_raises_not_modified_after_commit(self):
+        fetcher = CachingFetcher(self.cache_dir.name, fetcher=self.origin)
+        self.assertEqual(fetcher.fetch(self.url), "<p>facts</p>")
+        fetcher.commit()
+
+        with self.assertRaises(NotModified):
+            fetcher.fetch(self.url)
+        self.assertEqual(self.origin.requests[-1], {"If-None-Match": '"v1"'})
+
+    def test_uncommitted_responses_are_not_revalidated(self):
+        fetcher = CachingFetcher(self.cache_dir.name, fetcher=self.origin)
+        fetcher.fetch(self.url)
+
+        self.assertEqual(fetcher.fetch(self.url), "<p>facts</p>")
+        self.assertEqual(self.origin.requests[-1], {})
+
+    def test_cached_body_is_returned_when_not_skipping(self):
+        fetcher = CachingFetcher(self.cache_dir.name, fetcher=self.origin)
+        fetcher.fetch(self.url)
+        fetcher.commit()
+
+        refreshing = CachingFetcher(
+            self.cache_dir.name, fetcher=self.origin, skip_unchanged=False
+        )
+        self.assertEqual(refreshing.fetch(self.url), "<p>facts</p>")
+        self.assertEqual(self.origin.requests[-1], {"If-None-Match": '"v1"'})
+
+
+class BrowserPoolTests(TestCase):
+    def test_blocks_heavy_resources_and_ad_hosts(self):
+        self.assertTrue(BrowserPool.should_block("image", "https://a.example/x.png"))
+        self.assertTrue(
+            BrowserPool.should_block(
+                "script", "https://www.googletagmanager.com/gtm.js"
+            )
+        )
+        self.assertFalse(
+            BrowserPool.should_block("document", "https://hoorayheroes.com/")
+        )
+
+
+class StaticBrowser:
+    def __init__(self, html: str | None) -> None:
+        self.html = html
+        self.rendered: list[str] = []
+
+    def render(self, url: str, wait_for_selector: str | None = None) -> str:
+        self.rendered.append(url)
+        if self.html is None:
+            raise ConnectionError(url)
+        return self.html
+
+
+class HoorayHeroesFetchStrategyTests(TestCase):
+    url = HooRayHeroesAnimalsFunFactsExtractor.url
+    rendered_html = (
+        '<section class="cms-content"><h2>Cows have best friends</h2>'
+        "<p>They get stressed when apart.</p></section>"
+    )
+    shell_html = '<div id="app"></div>'
+
+    def make_extractor(
+        self,
+        http_html: str,
+        strategies: FetchStrategyStore,
+        rendered_html: str | None = rendered_html,
+    ):
+        browser = StaticBrowser(rendered_html)
+        extractor = HooRayHeroesAnimalsFunFactsExtractor(
+            fetcher=StaticFetcher({self.url: http_html}),
+            browser=browser,
+            strategies=strategies,
+        )
+        return extractor, browser
+
+    def test_server_rendered_page_skips_the_browser(self):
+        strategies = FetchStrategyStore()
+        extractor, browser = self.make_extractor(self.rendered_html, strategies)
+
+        facts = list(extractor.run())
+
+        self.assertEqual(facts[0].fact, "Cows have best friends")
+        self.assertEqual(browser.rendered, [])
+        self.assertEqual(strategies.get(self.url), "http")
+
+    def test_browser_strategy_is_remembered(self):
+        strategies = FetchStrategyStore()
+        extractor, browser = self.make_extractor(self.shell_html, strategies)
+        list(extractor.run())
+        self.assertEqual(strategies.get(self.url), "browser")
+
+        extractor.fetcher = None
+        facts = list(extractor.run())
+
+        self.assertEqual(facts[0].fact, "Cows have best friends")
+        self.assertEqual(browser.rendered, [self.url, self.url])
+
+    def test_unrendered_shell_is_an_error(self):
+        strategies = FetchStrategyStore()
+        extractor, browser = self.make_extractor(
+            self.shell_html, strategies, rendered_html=None
+        )
+
+        with self.assertRaises(RuntimeError):
+            list(extractor.run())
+        self.assertEqual(browser.rendered, [self.url])
+        self.assertIsNone(strategies.get(self.url))
+
+        strategies.set(self.url, "browser")
+        with self.assertRaises(RuntimeError):
+            list(extractor.run())
+        self.assertEqual(browser.rendered, [self.url, self.url])
+
+
+class HoorayHeroesCachedFetchTests(TestCase):
+    url = HooRayHeroesAnimalsFunFactsExtractor.url
+
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        self.origin = RevalidatingFetcher(
+            HoorayHeroesFetchStrategyTests.shell_html, '"shell"'
+        )
+        self.fetcher = CachingFetcher(cache_dir.name, fetcher=self.origin)
+        self.strategies = FetchStrategyStore()
+
+    def make_extractor(self, rendered_html: str | None):
+        return HooRayHeroesAnimalsFunFactsExtractor(
+            fetcher=self.fetcher,
+            browser=StaticBrowser(rendered_html),
+            strategies=self.strategies,
+        )
+
+    def test_probed_shell_is_not_cached(self):
+        list(self.make_extractor(HoorayHeroesFetchStrategyTests.rendered_html).run())
+        self.fetcher.commit()
+
+        self.fetcher.fetch(self.url)
+        self.assertEqual(self.origin.requests[-1], {})
+
+    def test_unchanged_fallback_after_a_browser_failure_is_an_error(self):
+        self.fetcher.fetch(self.url)
+        self.fetcher.commit()
+        self.strategies.set(self.url, "browser")
+
+        with self.assertRaises(RuntimeError):
+            list(self.make_extractor(None).run())
+        self.assertEqual(self.origin.requests[-1], {"If-None-Match": '"shell"'})
+
+
+class ParserBackendTests(TestCase):
+    html = (
+        "<ol><li><strong>Water is wet.</strong> H<sub>2</sub>O, see "
+        '<a href="/water">this <em>page</em></a><sup class="ref">1</sup></li>'
+        "<li>No bold here</li></ol>"
+    )
+
+    def test_parsers_extract_the_same_facts(self):
+        results = [
+            list(ScienceFocus121FactsExtractor(parser=parser)._process_html(self.html))
+            for parser in available_parsers()
+        ]
+
+        self.assertEqual(
+            results[0],
+            [
+                FactType(
+                    fact="Water is wet",
+                    identifier="water-is-wet",
+                    description="H<sub>2</sub>O, see this page<sup>1</sup>.",
+                ),
+                FactType(
+                    fact="No bold here", identifier="no-bold-here", description=""
+                ),
+            ],
+        )
+        for result in results[1:]:
+            self.assertEqual(result, results[0])
+
+
+class StreamingPipelineTests(TestCase):
+    def test_storage_writes_while_extractors_are_still_producing(self):
+        produced = []
+        produced_at_first_write = []
+
+        class CountingExtractor:
+            url = "https://slow.example"
+
+            def run(self):
+                for fact in make_facts(50):
+                    produced.append(fact)
+                    yield fact
+
+        class RecordingStorage(DBStorage):
+            def _save_chunk(self, facts, result):
+                produced_at_first_write.append(len(produced))
+                super()._save_chunk(facts, result)
+
+        Scraper(
+            extractor=CountingExtractor(),
+            storage=RecordingStorage(chunk_size=5),
+            queue_size=1,
+        ).scrape()
+
+        self.assertEqual(Fact.objects.count(), 50)
+        self.assertLess(produced_at_first_write[0], 50)
+
+
+class ListingExtractor(BasePaginatedExtractor):
+    url = "https://list.example/facts/"
+
+    def _discover_pages(self, html):
+        return self._links(html, "nav a.page")
+
+    def _process_html(self, html):
+        for index, line in enumerate(html.split("|")):
+            yield FactType(fact=line, identifier=slugify(line), description="")
+
+
+class PaginatedExtractorTests(TestCase):
+    def test_discovered_pages_are_fetched_and_merged(self):
+        index = (
+            '<nav><a class="page" href="/facts/2">2</a>'
+            '<a class="page" href="3#top">3</a><a href="/about">About</a>'
+            '<a class="page" href="/facts/2">2</a></nav>'
+        )
+        fetcher = StaticFetcher(
+            {
+                ListingExtractor.url: index,
+                "https://list.example/facts/2": "Fact a|Fact b",
+                "https://list.example/facts/3": "Fact c",
+            }
+        )
+        extractor = ListingExtractor(
+            fetcher=fetcher, rate_limiter=DomainRateLimiter(requests_per_second=1000)
+        )
+
+        facts = list(extractor.run())
+
+        self.assertEqual(
+            sorted(fact.fact for fact in facts), ["Fact a", "Fact b", "Fact c"]
+        )
+        self.assertEqual(
+            sorted(extractor.page_urls),
+            ["https://list.example/facts/2", "https://list.example/facts/3"],
+        )
+
+
+class RevalidatingSite:
+    """
+    ``RevalidatingFetcher`` for several URLs, each with its own body and ETag.
+    """
+
+    def __init__(self, pages: dict[str, tuple[str, str]]) -> None:
+        self.pages = pages
+
+    def get(self, url, headers=None):
+        return RevalidatingFetcher(*self.pages[url]).get(url, headers)
+
+
+class CachedPaginatedExtractorTests(TestCase):
+    index = '<nav><a class="page" href="/facts/2">2</a><a class="page" href="3">3</a>'
+
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        self.site = RevalidatingSite(
+            {
+                ListingExtractor.url: (self.index, '"index"'),
+                "https://list.example/facts/2": ("Fact a|Fact b", '"2"'),
+                "https://list.example/facts/3": ("Fact c", '"3"'),
+            }
+        )
+        self.fetcher = CachingFetcher(cache_dir.name, fetcher=self.site)
+        self.extractor = ListingExtractor(
+            fetcher=self.fetcher,
+            rate_limiter=DomainRateLimiter(requests_per_second=1000),
+        )
+        list(self.extractor.run())
+        self.fetcher.commit()
+
+    def test_pages_of_an_unchanged_index_are_revalidated(self):
+        self.site.pages["https://list.example/facts/3"] = ("Fact d", '"3b"')
+
+        facts = list(self.extractor.run())
+
+        self.assertEqual([fact.fact for fact in facts], ["Fact d"])
+        self.assertEqual(self.extractor.page_urls, ["https://list.example/facts/3"])
+
+    def test_source_is_unchanged_when_no_page_changed(self):
+        with self.assertRaises(NotModified):
+            list(self.extractor.run())
+
+
+class ParseWorkerTests(TestCase):
+    def test_parsing_in_worker_processes_matches_in_thread_parsing(self):
+        url = ScienceFocus121FactsExtractor.url
+        html = (
+            "<ol><li><b>Bananas are berries.</b> Botanically, <i>strawberries</i> "
+            "are not.</li><li><strong>Honey never spoils</strong> H<sub>2</sub>O "
+            "content is low</li></ol>"
+        )
+        fetcher = StaticFetcher({url: html})
+        expected = list(ScienceFocus121FactsExtractor(fetcher=fetcher).run())
+
+        with make_parse_pool(1) as pool, recording(ScrapeMetrics()) as metrics:
+            extractor = ScienceFocus121FactsExtractor(
+                fetcher=fetcher, parse_executor=pool
+            )
+            facts = list(extractor.run())
+
+        self.assertEqual(len(facts), 2)
+        self.assertEqual(facts, expected)
+        # Timings recorded in the worker are merged back
+        self.assertEqual(metrics.stages["parse"].calls, 1)
+        self.assertEqual(metrics.stages["format"].calls, 2)
+
+
+class NearDuplicateFilterTests(TestCase):
+    pairs_path = Path(__file__).parent / "testdata" / "near_duplicate_pairs.json"
+
+    def make_fact(self, text: str, description: str = "") -> FactType:
+        return FactType(fact=text, identifier=slugify(text), description=description)
+
+    def test_labelled_pairs_are_told_apart(self):
+        pairs = json.loads(self.pairs_path.read_text(encoding="utf-8"))
+
+        for pair in pairs:
+            first, second = (
+                self.make_fact(pair[key]["fact"], pair[key]["description"])
+                for key in ("first", "second")
+            )
+            second.identifier += "-2"
+            dedupe = NearDuplicateFilter()
+            list(dedupe.filter([first, second]))
+
+            with self.subTest(first=first.fact, second=second.fact):
+                self.assertEqual(bool(dedupe.duplicates), pair["duplicate"])
+
+    def test_drops_near_duplicates_and_keeps_distinct_facts(self):
+        facts = [
+            self.make_fact("The shortest war in history lasted 38 minutes"),
+            self.make_fact("Honey never spoils"),
+            self.make_fact("The shortest war in history lasted 38 to 45 minutes"),
+            self.make_fact("A group of flamingos is called a flamboyance"),
+            self.make_fact("A group of pink flamingos is called a flamboyance"),
+        ]
+        dedupe = NearDuplicateFilter(drop=True)
+
+        kept = [fact.fact for fact in dedupe.filter(facts)]
+
+        self.assertEqual(
+            kept,
+            [
+                "The shortest war in history lasted 38 minutes",
+                "Honey never spoils",
+                "A group of flamingos is called a flamboyance",
+            ],
+        )
+        self.assertEqual(len(dedupe.duplicates), 2)
+
+    def test_flag_mode_keeps_duplicates(self):
+        facts = [
+            self.make_fact("Honey never spoils"),
+            self.make_fact("Honey never spoils!"),
+        ]
+        facts[1].identifier = "honey-never-spoils-2"
+        dedupe = NearDuplicateFilter()
+
+        self.assertEqual(len(list(dedupe.filter(facts))), 2)
+        self.assertEqual(
+            dedupe.duplicates, [("honey-never-spoils-2", "honey-never-spoils")]
+        )
+
+    def test_seeded_fact_with_the_same_identifier_is_not_a_duplicate(self):
+        dedupe = NearDuplicateFilter()
+        dedupe.add("honey-never-spoils", "Honey never spoils")
+
+        kept = list(dedupe.filter([self.make_fact("Honey never spoils")]))
+
+        self.assertEqual(len(kept), 1)
+
+    def test_stored_facts_are_seeded_only_when_facts_arrive(self):
+        seeded = []
+        dedupe = NearDuplicateFilter(seed=seeded.append)
+
+        self.assertEqual(list(dedupe.filter([])), [])
+        self.assertEqual(seeded, [])
+
+        list(dedupe.filter(make_facts(2)))
+        self.assertEqual(seeded, [dedupe])
+
+    def test_seeding_uses_stored_signatures_and_backfills_missing_ones(self):
+        DBStorage().save([self.make_fact("Honey never spoils")])
+        Fact.objects.bulk_create(
+            [
+                Fact(
+                    identifier="flamboyance",
+                    fact="A group of flamingos is called a flamboyance",
+                    description="",
+                    position=1,
+                )
+            ]
+        )
+        facts = [
+            self.make_fact("Honey never spoils!"),
+            self.make_fact("A group of pink flamingos is called a flamboyance"),
+        ]
+        facts[0].identifier = "honey-never-spoils-2"
+        dedupe = NearDuplicateFilter(seed=_seed_near_duplicates)
+
+        list(dedupe.filter(facts))
+
+        self.assertEqual(
+            [original for _, original in dedupe.duplicates],
+            ["honey-never-spoils", "flamboyance"],
+        )
+        self.assertEqual(
+            bytes(Fact.objects.get(identifier="flamboyance").dedupe_signature),
+            fact_signature("A group of flamingos is called a flamboyance", ""),
+        )
+
+
+class BenchmarkTests(TestCase):
+    def test_replays_snapshots_at_each_catalog_size(self):
+        extractors = [
+            (extractor, snapshot_path(type(extractor)).read_text(encoding="utf-8"))
+            for extractor in (
+                TodayInterestingFactsAdultsExtractor(),
+                HooRayHeroesAnimalsFunFactsExtractor(),
+            )
+        ]
+
+        version = get_catalog_version()
+
+        results = run_benchmark(extractors, catalog_sizes=[0, 20], repeat=1)
+
+        self.assertEqual(
+            [(result.key, result.facts) for result in results],
+            [
+                ("TodayInterestingFactsAdultsExtractor@0", 100),
+                ("HooRayHeroesAnimalsFunFactsExtractor@0", 30),
+                ("TodayInterestingFactsAdultsExtractor@20", 100),
+                ("HooRayHeroesAnimalsFunFactsExtractor@20", 30),
+            ],
+        )
+        for result in results:
+            self.assertEqual(set(result.seconds), {"parse", "format", "store"})
+        self.assertFalse(Fact.objects.exists())
+        self.assertEqual(get_catalog_version(), version)
+
+    def test_compare_reports_stages_slower_than_the_baseline(self):
+        result = BenchmarkResult(
+            "SomeExtractor", 0, facts=10, seconds={"parse": 0.05, "store": 0.0105}
+        )
+        baseline = {"SomeExtractor@0": {"parse": 0.02, "store": 0.01}}
+
+        regressions = compare([result], baseline, tolerance=0.2)
+
+        self.assertEqual(
+            [(regression.stage, regression.baseline) for regression in regressions],
+            [("parse", 0.02)],
+        )
+        self.assertEqual(compare([result], {}, tolerance=0.2), [])
+
+
+class FormatterGoldenTests(TestCase):
+    """
+    `formatter_golden.json` holds the expected output of the formatters; every
+    input is used as both title and description.
+    """
+
+    corpus_path = Path(__file__).parent / "testdata" / "formatter_golden.json"
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.corpus = json.loads(cls.corpus_path.read_text(encoding="utf-8"))
+        cls.formatters = {
+            "default": DefaultFactFormatter(),
+            "hoorayheroes": HoorayHeroesFactFormatter(),
+        }
+
+    def test_format_matches_golden_corpus(self):
+        for name, formatter in self.formatters.items():
+            for case in self.corpus:
+                with self.subTest(formatter=name, input=case["input"]):
+                    self.assertEqual(
+                        list(formatter.format(case["input"], case["input"])), case[name]
+                    )
+
+    def test_format_many_matches_format(self):
+        items = [(case["input"], case["input"]) for case in self.corpus]
+        for name, formatter in self.formatters.items():
+            with self.subTest(formatter=name):
+                self.assertEqual(
+                    formatter.format_many(items),
+                    [tuple(case[name]) for case in self.corpus],
+                )
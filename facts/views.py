@@ -1,9 +1,19 @@
+from django.core.cache import cache
+from django.http import HttpResponse
 from django.shortcuts import redirect, render
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
 from django.views import View
 
-from .models import Fact
+from .cache import (
+    daily_etag,
+    daily_key,
+    daily_last_modified,
+    get_daily_fact,
+    seconds_until_midnight,
+)
 
 
 class IndexView(View):
@@ -13,5 +23,30 @@ class IndexView(View):
 
 class RandomFactView(View):
     def get(self, request):
-        fact = Fact.get_fact_from_date(timezone.now().date())
-        return render(request, "facts/random_fact.html", {"fact": fact})
+        today = timezone.now().date()
+        fact = get_daily_fact(today)
+
+        etag = daily_etag(fact, today)
+        last_modified = daily_last_modified(fact, today)
+
+        response = get_conditional_response(
+            request, etag=etag, last_modified=int(last_modified.timestamp())
+        )
+        if response is None:
+            response = self._render(request, today, fact)
+
+        response.headers["ETag"] = etag
+        response.headers["Last-Modified"] = http_date(last_modified.timestamp())
+        patch_cache_control(response, max_age=seconds_until_midnight())
+        return response
+
+    def _render(self, request, today, fact):
+        page_key = daily_key("random_fact_page", today)
+
+        content = cache.get(page_key)
+        if content is not None:
+            return HttpResponse(content)
+
+        response = render(request, "facts/random_fact.html", {"fact": fact})
+        cache.set(page_key, response.content, timeout=seconds_until_midnight())
+        return response
@@ -14,6 +14,7 @@ import os
 from pathlib import Path
 from shutil import which
 
+from django.core.exceptions import ImproperlyConfigured
 from dotenv import load_dotenv
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -108,12 +109,105 @@ LOGGING = {
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
-DATABASES = {
+# DB_ENGINE is "sqlite" (a file next to the code, the default) or "postgres"
+# (POSTGRES_* variables, needs the `postgres` extra). SQLite allows a single
+# writer on a single host; Postgres lifts both limits.
+
+DB_ENGINES = ("sqlite", "postgres")
+DB_ENGINE = os.getenv("DB_ENGINE", "sqlite")
+if DB_ENGINE not in DB_ENGINES:
+    raise ImproperlyConfigured(
+        f"DB_ENGINE must be one of {', '.join(DB_ENGINES)}, not '{DB_ENGINE}'"
+    )
+
+if DB_ENGINE == "sqlite":
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": BASE_DIR / "db.sqlite3",
+            "OPTIONS": {
+                # Seconds to wait for a lock held by another writer (e.g. scrape_facts)
+                "timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT", 20)),
+            },
+        }
+    }
+else:
+    # Behind PgBouncer in transaction mode (POSTGRES_PGBOUNCER=True) a session
+    # may run on a different server connection each transaction, so named
+    # server-side cursors and prepared statements cannot be used.
+    POSTGRES_PGBOUNCER = os.getenv("POSTGRES_PGBOUNCER") == "True"
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": os.getenv("POSTGRES_DB", "randomfactdaily"),
+            "USER": os.getenv("POSTGRES_USER", "randomfactdaily"),
+            "PASSWORD": os.getenv("POSTGRES_PASSWORD", ""),
+            "HOST": os.getenv("POSTGRES_HOST", "127.0.0.1"),
+            "PORT": os.getenv("POSTGRES_PORT", "5432"),
+            "DISABLE_SERVER_SIDE_CURSORS": POSTGRES_PGBOUNCER,
+            "OPTIONS": {
+                "connect_timeout": int(os.getenv("POSTGRES_CONNECT_TIMEOUT", 10)),
+            },
+        }
+    }
+    if POSTGRES_PGBOUNCER:
+        DATABASES["default"]["OPTIONS"]["prepare_threshold"] = None
+
+# Keep connections open between requests instead of one per request, so each
+# worker thread reuses its own connection
+DATABASES["default"]["CONN_MAX_AGE"] = int(os.getenv("DB_CONN_MAX_AGE", 600))
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+
+# Applied to every new SQLite connection (see common.db). WAL lets requests
+# read while a scraper run writes; NORMAL sync is safe with WAL. Cache and
+# mmap sizes are per connection and kept small for the 384M memory limit.
+SQLITE_PRAGMAS = {
+    "journal_mode": "wal",
+    "synchronous": "normal",
+    "cache_size": -int(os.getenv("SQLITE_CACHE_SIZE_KB", 16 * 1024)),
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", 64 * 1024 * 1024)),
+    "temp_store": "memory",
+}
+
+# Cache
+# CACHE_BACKEND is "locmem" (one cache per process, the default), "file"
+# (CACHE_LOCATION is a directory) or "redis" (CACHE_LOCATION is a redis:// URL,
+# needs the `redis` extra). Only the last two are shared between workers.
+
+CACHE_BACKENDS = {
+    "locmem": "common.cache.LocMemCache",
+    "file": "common.cache.FileBasedCache",
+    "redis": "common.cache.RedisCache",
+}
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "locmem")
+if CACHE_BACKEND not in CACHE_BACKENDS:
+    raise ImproperlyConfigured(
+        f"CACHE_BACKEND must be one of {', '.join(CACHE_BACKENDS)}, "
+        f"not '{CACHE_BACKEND}'"
+    )
+
+CACHE_LOCATIONS = {
+    "locmem": "randomfactdaily",
+    "file": BASE_DIR / ".cache",
+    "redis": "redis://127.0.0.1:6379/0",
+}
+
+CACHES = {
     "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+        "BACKEND": CACHE_BACKENDS[CACHE_BACKEND],
+        "LOCATION": os.getenv("CACHE_LOCATION", CACHE_LOCATIONS[CACHE_BACKEND]),
+        "KEY_PREFIX": os.getenv("CACHE_KEY_PREFIX", "randomfactdaily"),
+        "TIMEOUT": int(os.getenv("CACHE_TIMEOUT", 300)),
     }
 }
+if CACHE_BACKEND != "redis":
+    # Bounded to stay well within the web container's 384M memory limit, a
+    # third of the entries is evicted when full. Redis is bounded by its own
+    # maxmemory policy instead.
+    CACHES["default"]["OPTIONS"] = {
+        "MAX_ENTRIES": int(os.getenv("CACHE_MAX_ENTRIES", 500)),
+        "CULL_FREQUENCY": 3,
+    }
 
 
 # Password validation
@@ -189,6 +283,15 @@ JET_THEMES = [
     {"theme": "light-gray", "color": "#222", "title": "Light Gray"},
 ]
 
+# Site settings
+# How long each process reuses its copy of a singleton (e.g. SiteSettings)
+# before checking whether it was saved elsewhere
+SINGLETON_REVALIDATE_SECONDS = float(os.getenv("SINGLETON_REVALIDATE_SECONDS", 5))
+
+# Scraping
+# On-disk HTTP response cache used by `scrape_facts` to revalidate sources
+SCRAPING_CACHE_DIR = Path(os.getenv("SCRAPING_CACHE_DIR", BASE_DIR / ".scraping_cache"))
+
 # Accounts redirect urls
 LOGIN_REDIRECT_URL = "common:index"
 LOGIN_URL = "accounts:login"